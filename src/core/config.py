@@ -3,11 +3,23 @@ Configuration management for P4 MCP server
 """
 import os
 import logging
+import functools
 from typing import Optional, Dict, Any, Union
 from dataclasses import dataclass, field
 
 logger = logging.getLogger(__name__)
 
+# Snapshot of os.environ taken on first Config.load(); see Config.refresh_env()
+_ENV_SNAPSHOT: Optional[Dict[str, str]] = None
+
+
+def _env() -> Dict[str, str]:
+    """Return the cached environment snapshot, taking it on first use"""
+    global _ENV_SNAPSHOT
+    if _ENV_SNAPSHOT is None:
+        _ENV_SNAPSHOT = dict(os.environ)
+    return _ENV_SNAPSHOT
+
 @dataclass
 class Config:
     """Configuration for P4 MCP server"""
@@ -27,18 +39,35 @@ class Config:
 
     @classmethod
     def load(cls) -> 'Config':
-        """Load configuration from file or environment variables"""
-        
+        """Load configuration from file or environment variables
+
+        The values are derived once per process (see ``_load_data``); each call
+        still returns a fresh instance since callers update it in place.
+        """
+        return cls(**cls._load_data())
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _load_data() -> Dict[str, Any]:
+        """Derive configuration values from the environment snapshot"""
+        env = _env()
+
         # Default configuration
         config_data = {
-            "p4port": os.getenv("P4PORT"),
-            "p4user": os.getenv("P4USER"),
-            "p4client": os.getenv("P4CLIENT"),
-            "log_level": os.getenv("LOG_LEVEL", "INFO"),
-            "ssl_verify": cls._parse_ssl_verify(),
+            "p4port": env.get("P4PORT"),
+            "p4user": env.get("P4USER"),
+            "p4client": env.get("P4CLIENT"),
+            "log_level": env.get("LOG_LEVEL", "INFO"),
+            "ssl_verify": Config._parse_ssl_verify(),
         }
-        config_data = {k: v for k, v in config_data.items() if v is not None}
-        return cls(**config_data)
+        return {k: v for k, v in config_data.items() if v is not None}
+
+    @classmethod
+    def refresh_env(cls) -> None:
+        """Discard the cached environment snapshot so the next load() re-reads os.environ"""
+        global _ENV_SNAPSHOT
+        _ENV_SNAPSHOT = None
+        cls._load_data.cache_clear()
 
     @staticmethod
     def _parse_ssl_verify() -> Union[bool, str]:
@@ -51,14 +80,15 @@ class Config:
         Returns:
             str path, True, or False.
         """
-        ca_bundle = os.getenv("P4MCP_CA_BUNDLE")
+        env = _env()
+        ca_bundle = env.get("P4MCP_CA_BUNDLE")
         if ca_bundle:
             if os.path.isfile(ca_bundle):
                 logger.info("Using custom CA bundle for Swarm SSL: %s", ca_bundle)
                 return ca_bundle
             logger.warning("P4MCP_CA_BUNDLE path does not exist: %s — ignoring", ca_bundle)
 
-        ssl_flag = os.getenv("P4MCP_SSL_VERIFY", "true").strip().lower()
+        ssl_flag = env.get("P4MCP_SSL_VERIFY", "true").strip().lower()
         if ssl_flag == "false":
             logger.info("Swarm SSL verification disabled via P4MCP_SSL_VERIFY=false")
             import urllib3
@@ -1,20 +1,87 @@
 """
 P4Python connection management with session tracking
 """
+import asyncio
 import logging
-import uuid
+import itertools
 import time
 import os
 import json
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any, Union, TYPE_CHECKING
 from contextlib import asynccontextmanager
-from P4 import P4, P4Exception
 from .config import Config
 
+if TYPE_CHECKING:
+    from P4 import P4
+
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the stdlib encoder
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+
+# P4Python module, imported on first session creation (see _p4())
+_P4_MODULE = None
+
+
+def _p4():
+    """Return the P4Python module, importing the C extension on first use"""
+    global _P4_MODULE
+    if _P4_MODULE is None:
+        import P4
+        _P4_MODULE = P4
+    return _P4_MODULE
+
+
+# Detected P4CONFIG file per working directory
+_P4CONFIG_CACHE: Dict[str, Optional[str]] = {}
+
+
+# Last formatted wall-clock second, reused by _fmt_now() within the same second
+_LAST_SEC, _LAST_STR = 0, ""
+
+
+def _fmt_now() -> str:
+    """Return the current local time as 'YYYY-MM-DD HH:MM:SS', formatting at most once per second"""
+    global _LAST_SEC, _LAST_STR
+    now = int(time.time())
+    if now != _LAST_SEC:
+        _LAST_SEC, _LAST_STR = now, time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now))
+    return _LAST_STR
+
+
+def _dump_session_json(session_info: Dict[str, Any]) -> bytes:
+    """Serialize session info to indented JSON bytes in a single pass"""
+    if orjson is not None:
+        return orjson.dumps(session_info, default=str, option=orjson.OPT_INDENT_2)
+    return json.dumps(session_info, indent=2, default=str).encode("utf-8")
+
 __version__ = "2026.1.2933350"
 
+# Per-process sequence for generated session IDs
+_session_counter = itertools.count()
+
+# Cached reference to the root-handler filter exposing set_session_id (if any)
+_UNSET = object()
+_SESSION_FILTER_REF = _UNSET
+
+
+def _find_session_filter():
+    """Return the first root-handler filter with ``set_session_id``, scanning only once"""
+    global _SESSION_FILTER_REF
+    if _SESSION_FILTER_REF is _UNSET:
+        _SESSION_FILTER_REF = None
+        for handler in logging.getLogger().handlers:
+            for filter in handler.filters:
+                if hasattr(filter, 'set_session_id'):
+                    _SESSION_FILTER_REF = filter
+                    break
+            if _SESSION_FILTER_REF is not None:
+                break
+    return _SESSION_FILTER_REF
+
 class P4Session:
     """Manages P4 session with tracking and logging"""
     
@@ -27,40 +94,43 @@ class P4Session:
             session_id: Optional session ID to use (will generate one if not provided)
         """
         self.config = config
-        self.p4 = P4(cwd=os.getcwd())
-        # Use provided session_id or generate a new one
-        self.session_id = session_id or str(uuid.uuid4())
+        cwd = os.getcwd()
+        self.p4 = _p4().P4(cwd=cwd)
         self.start_time = time.time()
+        # Use provided session_id or generate one; pid + start time + sequence is
+        # unique per host without the urandom read and formatting of uuid4()
+        self.session_id = session_id or f"{os.getpid()}-{int(self.start_time)}-{next(_session_counter):x}"
         self.save_to_file = save_to_file
         self.session_file = f".p4session_{self.session_id}.json"
+        self._session_fp = None  # opened on first _record_session, reused afterwards
         self._is_connected = False
         
         # Set up logger with session context
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
         # Add session filter to ensure session_id is included in logs
-        for handler in logging.getLogger().handlers:
-            for filter in handler.filters:
-                if hasattr(filter, 'set_session_id'):
-                    filter.set_session_id(self.session_id)
+        session_filter = _find_session_filter()
+        if session_filter is not None:
+            session_filter.set_session_id(self.session_id)
+
+        env_set = True
+        # Resolution notes are collected and emitted as a single log record
+        msgs = []
+        warn = False
 
-        env_set = True 
-        
         # Prefer explicit MCP config values; otherwise defer to P4CONFIG / env
         if hasattr(self.config, 'p4port') and self.config.p4port:
             self.p4.port = self.config.p4port
         else:
             env_set = False
-            self.logger.warning(
-                'P4PORT not specified in MCP config; falling back to P4CONFIG file or environment variables'
-            )
+            warn = True
+            msgs.append('P4PORT not specified in MCP config; falling back to P4CONFIG file or environment variables')
 
         if hasattr(self.config, 'p4user') and self.config.p4user:
             self.p4.user = self.config.p4user
         else:
             env_set = False
-            self.logger.warning(
-                'P4USER not specified in MCP config; falling back to P4CONFIG file or environment variables'
-            )
+            warn = True
+            msgs.append('P4USER not specified in MCP config; falling back to P4CONFIG file or environment variables')
 
         # Optional: client may intentionally be omitted for auto-discovery
         if hasattr(self.config, 'p4client') and self.config.p4client:
@@ -68,40 +138,48 @@ class P4Session:
 
         # If any primary fields were missing, describe how remaining values are sourced
         if not env_set:
-            p4config_path = self.p4.p4config_file
+            # P4Python walks parent directories to find the file; reuse the result per cwd
+            if cwd not in _P4CONFIG_CACHE:
+                _P4CONFIG_CACHE[cwd] = self.p4.p4config_file
+            p4config_path = _P4CONFIG_CACHE[cwd]
             if not p4config_path or p4config_path == 'noconfig':
-                self.logger.warning(
-                    'No P4CONFIG file detected; using only current process environment for unset values'
-                )
+                msgs.append('No P4CONFIG file detected; using only current process environment for unset values')
             else:
-                self.logger.info(f'Detected P4CONFIG file: {p4config_path}')
+                msgs.append(f'Detected P4CONFIG file: {p4config_path}')
 
         # Summarize final connection parameters
         if self.p4.port and self.p4.user:
-            self.logger.info(
-                f'Using P4 connection parameters: P4PORT="{self.p4.port}", P4USER="{self.p4.user}"'
-            )
+            msgs.append(f'Using P4 connection parameters: P4PORT="{self.p4.port}", P4USER="{self.p4.user}"')
         else:
-            self.logger.warning(
-                'P4PORT and/or P4USER still unset; Perforce connection may fail'
-            )
+            warn = True
+            msgs.append('P4PORT and/or P4USER still unset; Perforce connection may fail')
+
+        self.logger.log(
+            logging.WARNING if warn else logging.INFO,
+            "P4 connection resolution: %s", "; ".join(msgs)
+        )
 
         # Set program name and version for server logging
         self.p4.prog = "P4-MCP-Server"
         self.p4.version = __version__
 
+    def _connect_and_describe(self):
+        """Connect, validate the ticket and return the `p4 info` record"""
+        res = self.p4.connect()
+        self.logger.info(f"P4 connection status: {res}")
+
+        # Handle authentication if needed
+        if self.p4.ticket_file:
+            self.p4.run("login", "-s")
+
+        return self.p4.run("info")[0]
+
     async def connect(self):
         """Establish P4 connection and record session"""
         try:
             self.logger.info(f"Connecting to P4 server")
-            res = self.p4.connect()
-            self.logger.info(f"P4 connection status: {res}")
-
-            # Handle authentication if needed
-            if self.p4.ticket_file:
-                self.p4.run("login", "-s")
-
-            info = self.p4.run("info")[0]
+            # connect/login/info block on the network; keep them off the event loop
+            info = await asyncio.to_thread(self._connect_and_describe)
             server_version = info["serverVersion"].split(" ")[0]
 
             parts = server_version.split("/")
@@ -110,10 +188,10 @@ class P4Session:
             self._is_connected = True
             
             # Record session information
-            self._record_session()
+            await self._record_session()
             return True
             
-        except P4Exception as e:
+        except _p4().P4Exception as e:
             self.logger.error(f"P4Error: Failed to connect to P4 server: {e}")
             self._is_connected = False
             raise
@@ -125,20 +203,20 @@ class P4Session:
                 if self.p4.connected():
                     self.p4.disconnect()
                 logger.info(f"P4 session ended (Duration: {time.time() - self.start_time:.2f}s)")
-            except P4Exception as e:
+            except _p4().P4Exception as e:
                 logger.error(f"P4Error: Error ending P4 session: {e}")
             finally:
                 self._is_connected = False
-                self._cleanup_session()
+                await self._cleanup_session()
     
-    def _record_session(self):
+    async def _record_session(self):
         """Record and save session information"""
         # Get server info if connected
         server_info = {}
         if self._is_connected and self.p4.connected():
             try:
                 server_info = self.p4.run('info')[0]
-            except P4Exception:
+            except _p4().P4Exception:
                 pass
 
         session_info = {
@@ -150,7 +228,7 @@ class P4Session:
                 'user': self.p4.user,
                 'client': getattr(self.p4, 'client', None),
                 'connected': self._is_connected,
-                'connection_time': time.strftime('%Y-%m-%d %H:%M:%S'),
+                'connection_time': _fmt_now(),
                 'server_info': server_info
             },
             'pid': os.getpid()
@@ -158,18 +236,41 @@ class P4Session:
         
         if self.save_to_file:
             try:
-                with open(self.session_file, 'w') as f:
-                    json.dump(session_info, f, indent=2, default=str)
+                data = _dump_session_json(session_info)
+                # Keep blocking file I/O off the event loop
+                await asyncio.to_thread(self._write_session_file, data)
                 self.logger.debug(f"Session data saved to session file")
             except IOError as e:
                 self.logger.error(f"Could not save session file: {e}")
 
         return session_info
-    def _cleanup_session(self):
+
+    def _write_session_file(self, data: bytes) -> None:
+        """Rewrite the session file in place on the (lazily opened) handle"""
+        if self._session_fp is None:
+            self._session_fp = open(self.session_file, 'w+b', buffering=64 * 1024)
+        self._session_fp.seek(0)
+        self._session_fp.truncate()
+        self._session_fp.write(data)
+        self._session_fp.flush()
+
+    async def _cleanup_session(self):
         """Clean up session resources"""
-        if self.save_to_file and os.path.exists(self.session_file):
+        await asyncio.to_thread(self._remove_session_file)
+
+    def _remove_session_file(self) -> None:
+        """Close and delete the session file"""
+        if self._session_fp is not None:
+            try:
+                self._session_fp.close()
+            except OSError as e:
+                logger.warning(f"Could not close session file: {e}")
+            self._session_fp = None
+        if self.save_to_file:
             try:
                 os.remove(self.session_file)
+            except FileNotFoundError:
+                pass
             except OSError as e:
                 logger.warning(f"Could not remove session file: {e}")
 
@@ -183,6 +284,9 @@ class P4Session:
 
 class P4ConnectionManager:
     """Manages P4Python connections with session tracking and proper cleanup"""
+
+    LOGIN_CHECK_INTERVAL = 300  # seconds between `p4 login -s` ticket checks
+    READ_CACHE_SIZE = 512  # read_cache entries before it is cleared wholesale
     
     def __init__(self, config: Config, save_session_to_file: bool = False):
         """Initialize P4 connection manager
@@ -192,10 +296,21 @@ class P4ConnectionManager:
             save_session_to_file: If True, saves session details to a file
         """
         self.config = config
-        self._connection: Optional[P4] = None
+        self._connection: Optional["P4"] = None
         self._is_connected = False
         self._session = P4Session(config, save_to_file=save_session_to_file)
         self.session_id = self._session.session_id
+        self._last_login_check = float('-inf')  # monotonic time of the last 'login -s'; -inf forces a check
+        # The P4 handle is not thread-safe; one task at a time may hold it while
+        # its commands run on worker threads. Re-entry by the owning task is allowed.
+        self._lock: Optional[asyncio.Lock] = None
+        self._owner: Optional[asyncio.Task] = None
+        # userName reported by `p4 info`, fixed for the lifetime of the connection
+        self._user: Optional[str] = None
+        self._user_lock: Optional[asyncio.Lock] = None
+        # key -> (timestamp, result) for recent read results; shared with the
+        # tool layer (P4MCPServer.read_cache), which clears it on every write
+        self.read_cache: Dict[tuple, tuple] = {}
     
     async def initialize(self):
         """Initialize P4 connection"""
@@ -205,13 +320,61 @@ class P4ConnectionManager:
                 await self._session.connect()
                 self._is_connected = True
             
-        except P4Exception as e:
+        except _p4().P4Exception as e:
             logger.error(f"P4Error: Failed to connect to P4: {e}")
+            # Let the next get_connection() run initialize() again
+            self._connection = None
             raise
     
     @asynccontextmanager
     async def get_connection(self):
-        """Get P4 connection context manager"""
+        """Get P4 connection context manager, exclusive to the calling task"""
+        task = asyncio.current_task()
+        if self._owner is task:
+            # Nested use from the task already holding the connection
+            yield self._connection
+            return
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            self._owner = task
+            try:
+                async with self._open_connection() as p4:
+                    yield p4
+            finally:
+                self._owner = None
+
+    async def get_user(self, p4) -> str:
+        """Return the server-side userName for the connection, running `p4 info` only once"""
+        if self._user is None:
+            if self._user_lock is None:
+                self._user_lock = asyncio.Lock()
+            async with self._user_lock:
+                if self._user is None:
+                    info = await asyncio.to_thread(p4.run, "info")
+                    self._user = info[0]["userName"]
+        return self._user
+
+    def run_cached(self, p4, *args, ttl: float):
+        """Run a read-only command, reusing its result for ``ttl`` seconds
+
+        Entries are keyed by client and arguments and live in ``read_cache``,
+        which the tool layer clears on every write.
+        """
+        key = ("run", p4.client, *args)
+        now = time.monotonic()
+        hit = self.read_cache.get(key)
+        if hit is not None and now - hit[0] < ttl:
+            return hit[1]
+        result = p4.run(*args)
+        if len(self.read_cache) >= self.READ_CACHE_SIZE:
+            self.read_cache.clear()
+        self.read_cache[key] = (now, result)
+        return result
+
+    @asynccontextmanager
+    async def _open_connection(self):
+        """Validate the shared P4 connection and translate P4 errors"""
         if not self._is_connected and not self._connection:
             await self.initialize()
         
@@ -224,19 +387,26 @@ class P4ConnectionManager:
                 except:
                     pass
                 self._connection.connect()
+                self._last_login_check = float('-inf')
+                self._user = None
 
-            if self._connection.ticket_file:
+            # Re-validate the ticket at most once per LOGIN_CHECK_INTERVAL
+            now = time.monotonic()
+            if self._connection.ticket_file and now - self._last_login_check > self.LOGIN_CHECK_INTERVAL:
                 self._connection.run("login", "-s")
+                self._last_login_check = now
             
             yield self._connection
             
-        except P4Exception as e:
+        except _p4().P4Exception as e:
             error_msg = str(e)
             logger.error(f"P4Error: P4 operation error: {error_msg}")
             
             # If authentication fails, force full disconnect/reconnect to reload ticket file
             if "P4PASSWD" in error_msg or "password" in error_msg.lower() or "expired" in error_msg.lower():
                 logger.info("Authentication error detected - forcing ticket reload")
+                self._last_login_check = float('-inf')
+                self._user = None
                 try:
                     # Complete disconnect to clear P4's internal ticket cache
                     self._connection.disconnect()
@@ -254,4 +424,5 @@ class P4ConnectionManager:
             await self._session.disconnect()
         
         self._is_connected = False
-        self._connection = None
\ No newline at end of file
+        self._connection = None
+        self._user = None
\ No newline at end of file
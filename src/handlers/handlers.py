@@ -26,63 +26,86 @@ _HANDLER_MODULES = [
 ]
 
 
+def _build_dispatch_spec():
+    """Inspect every handler module once and describe how to wire it up.
+
+    Returns a list of ``(handler_cls, svc_name, routes)`` tuples, where
+    ``routes`` maps ``(operation, resource)`` keys to handler method names.
+    The result depends only on the handler classes, so it is computed once
+    at import time and shared by every ``Handlers`` instance.
+    """
+    spec = []
+    for module in _HANDLER_MODULES:
+
+        # Find the handler class: any class defined in this module
+        # whose name ends with "Handlers"
+        handler_cls = None
+        for name, obj in inspect.getmembers(module, inspect.isclass):
+            if name.endswith("Handlers") and obj.__module__ == module.__name__:
+                handler_cls = obj
+                break
+        if handler_cls is None:
+            continue
+
+        # Derive the service kwarg from the handler __init__ signature
+        sig = inspect.signature(handler_cls.__init__)
+        svc_param_names = [
+            p for p in sig.parameters if p != "self" and p.endswith("_services")
+        ]
+        if not svc_param_names:
+            continue
+
+        # Collect _handle_query_* and _handle_modify_* methods
+        routes = {}
+        for attr_name in dir(handler_cls):
+            if attr_name.startswith("_handle_query_"):
+                resource = attr_name[len("_handle_query_"):]
+                routes[("query", resource)] = attr_name
+            elif attr_name.startswith("_handle_modify_"):
+                resource = attr_name[len("_handle_modify_"):]
+                routes[("modify", resource)] = attr_name
+
+        spec.append((handler_cls, svc_param_names[0], routes))  # e.g. "workspace_services"
+    return tuple(spec)
+
+
+_DISPATCH_SPEC = _build_dispatch_spec()
+
+_EMPTY = {}
+
+
 class Handlers:
     """Main handler class that registers per-resource handler modules.
 
     Every ``<resource>_handlers`` module listed in ``_HANDLER_MODULES`` is
-    inspected.  Its handler class (ending with ``Handlers``) is instantiated
-    with the matching ``<resource>_services`` kwarg, and any
-    ``_handle_query_<resource>`` / ``_handle_modify_<resource>`` methods are
-    registered in the dispatch table.
+    inspected once at import time (see ``_DISPATCH_SPEC``).  Its handler class
+    (ending with ``Handlers``) is instantiated with the matching
+    ``<resource>_services`` kwarg, and any ``_handle_query_<resource>`` /
+    ``_handle_modify_<resource>`` methods are registered in the dispatch table.
     """
 
     def __init__(self, **services):
         self.dispatch = {}
 
-        for module in _HANDLER_MODULES:
-
-            # Find the handler class: any class defined in this module
-            # whose name ends with "Handlers"
-            handler_cls = None
-            for name, obj in inspect.getmembers(module, inspect.isclass):
-                if name.endswith("Handlers") and obj.__module__ == module.__name__:
-                    handler_cls = obj
-                    break
-            if handler_cls is None:
-                continue
-
-            # Derive the service kwarg from the handler __init__ signature
-            sig = inspect.signature(handler_cls.__init__)
-            svc_param_names = [
-                p for p in sig.parameters if p != "self" and p.endswith("_services")
-            ]
-            if not svc_param_names:
-                continue
-
-            svc_name = svc_param_names[0]          # e.g. "workspace_services"
+        for handler_cls, svc_name, routes in _DISPATCH_SPEC:
             svc_instance = services.get(svc_name)
             if svc_instance is None:
                 continue
 
             handler_instance = handler_cls(svc_instance)
-
-            # Register _handle_query_* and _handle_modify_* methods
-            for attr_name in dir(handler_instance):
-                if attr_name.startswith("_handle_query_"):
-                    resource = attr_name[len("_handle_query_"):]
-                    self.dispatch[("query", resource)] = getattr(handler_instance, attr_name)
-                elif attr_name.startswith("_handle_modify_"):
-                    resource = attr_name[len("_handle_modify_"):]
-                    self.dispatch[("modify", resource)] = getattr(handler_instance, attr_name)
+            for (operation, resource), attr_name in routes.items():
+                self.dispatch.setdefault(operation, {})[resource] = getattr(handler_instance, attr_name)
 
         logger.debug(
             "Handler dispatch table: %s",
-            sorted(self.dispatch.keys()),
+            sorted((op, res) for op, resources in self.dispatch.items() for res in resources),
         )
 
     async def handle(self, operation, sub_operation, params):
-        handler = self.dispatch.get((operation, sub_operation))
+        # Nested {operation: {resource: handler}} lookup avoids a key tuple per call
+        handler = self.dispatch.get(operation, _EMPTY).get(sub_operation)
         if not handler:
             logger.error(f"Unknown operation: {operation}/{sub_operation}")
             return {"status": "error", "message": f"Unknown operation: {operation}/{sub_operation}"}
+
         return await handler(params)
\ No newline at end of file
@@ -10,16 +10,9 @@ class ReviewsHandlers:
 
     @handle_errors
     async def _handle_query_reviews(self, params):
-        actions_requiring_id = [
-            "get", "transitions", "files_readby", "files",
-            "activity", "archive", "comments"
-        ]
-
-        if params.action in actions_requiring_id and not params.review_id:
-            logger.error(f"review_id is required for action: {params.action}")
-            raise ValueError(f"review_id is required for action: {params.action}")
+        action = params.action
 
-        if params.action == "list":
+        if action == "list":
             result = await self.review_services.list_reviews(
                 max_results=params.max_results,
                 after=params.after,
@@ -32,32 +25,32 @@ class ReviewsHandlers:
                 fields=params.fields,
             )
 
-        elif params.action == "dashboard":
+        elif action == "dashboard":
             # review_dashboard(max_results)
             result = await self.review_services.review_dashboard(
                 getattr(params, "max_results", None)
             )
 
-        elif params.action == "transitions":
+        elif action == "transitions":
             # get_review_transitions(review_id)
             result = await self.review_services.get_review_transitions(
                 params.review_id
             )
 
-        elif params.action == "get":
+        elif action == "get":
             result = await self.review_services.get_review_info(
                 params.review_id,
                 params.fields,
                 params.include_transitions or False,
             )
 
-        elif params.action == "files_readby":
+        elif action == "files_readby":
             # get_review_files_readby(review_id)
             result = await self.review_services.get_review_files_readby(
                 params.review_id
             )
 
-        elif params.action == "files":
+        elif action == "files":
             # get_review_files(review_id, from_version, to_version)
             result = await self.review_services.get_review_files(
                 params.review_id,
@@ -65,26 +58,26 @@ class ReviewsHandlers:
                 getattr(params, "to_version", None)
             )
 
-        elif params.action == "activity":
+        elif action == "activity":
             # get_review_activity(review_id, max_results, after, fields)
             result = await self.review_services.get_review_activity(
                 params.review_id,
                 getattr(params, "max_results", None),
             )
 
-        elif params.action == "comments":
+        elif action == "comments":
             # get_review_comments(review_id)
             result = await self.review_services.get_review_comments(
                 params.review_id
             )
 
         else:
-            logger.error(f"Unknown review query action: {params.action}")
-            raise ValueError(f"Unknown review query action: {params.action}")
+            logger.error(f"Unknown review query action: {action}")
+            raise ValueError(f"Unknown review query action: {action}")
 
         return {
             "status": result["status"],
-            "action": params.action,
+            "action": action,
             "message": result["message"]
         }
 
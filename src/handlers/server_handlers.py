@@ -8,16 +8,21 @@ logger = logging.getLogger(__name__)
 
 class ServerHandlers:
 
+    # action -> service call; each entry returns the service coroutine
+    _QUERY_ACTIONS = {
+        "server_info": lambda self, p: self.server_services.get_server_info(),
+        "current_user": lambda self, p: self.server_services.get_current_user(),
+    }
+
     def __init__(self, server_services):
         self.server_services = server_services
 
     @handle_errors
     async def _handle_query_server(self, params):
-        if params.action == "server_info":
-            result = await self.server_services.get_server_info()
-        elif params.action == "current_user":
-            result = await self.server_services.get_current_user()
-        else:
-            logger.error(f"Unknown server query action: {params.action}")
-            raise ValueError(f"Unknown server query action: {params.action}")
-        return {"status": "success", "action": params.action, "data": result}
+        action = params.action
+        fn = self._QUERY_ACTIONS.get(action)
+        if fn is None:
+            logger.error(f"Unknown server query action: {action}")
+            raise ValueError(f"Unknown server query action: {action}")
+        result = await fn(self, params)
+        return {"status": "success", "action": action, "data": result}
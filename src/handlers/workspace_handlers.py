@@ -8,47 +8,39 @@ logger = logging.getLogger(__name__)
 
 class WorkspacesHandlers:
 
+    # action -> service call; each entry returns the service coroutine
+    _QUERY_ACTIONS = {
+        "get": lambda self, p: self.workspace_services.get_workspace(p.workspace_name),
+        "list": lambda self, p: self.workspace_services.list_workspaces(p.user, p.max_results),
+        "type": lambda self, p: self.workspace_services.get_workspace_type(p.workspace_name),
+        "status": lambda self, p: self.workspace_services.get_workspace_status(p.workspace_name),
+    }
+
+    _MODIFY_ACTIONS = {
+        "create": lambda self, p: self.workspace_services.create_workspace(p.specs.model_dump(exclude_none=True)),
+        "delete": lambda self, p: self.workspace_services.delete_workspace(p.name),
+        "update": lambda self, p: self.workspace_services.update_workspace(p.name, p.specs.model_dump(exclude_none=True)),
+        "switch": lambda self, p: self.workspace_services.switch_workspace(p.name),
+    }
+
     def __init__(self, workspace_services):
         self.workspace_services = workspace_services
 
     @handle_errors
     async def _handle_query_workspaces(self, params):
-
-        if not params.workspace_name and params.action in ["get", "type", "status"]:
-            logger.error(f"workspace name is required for this {params.action} action")
-            raise ValueError(f"workspace_name is required for this {params.action} action")
-
-        if params.action == "get":
-            result = await self.workspace_services.get_workspace(params.workspace_name)
-        elif params.action == "list":
-            result = await self.workspace_services.list_workspaces(params.user, params.max_results)
-        elif params.action == "type":
-            result = await self.workspace_services.get_workspace_type(params.workspace_name)
-        elif params.action == "status":
-            result = await self.workspace_services.get_workspace_status(params.workspace_name)
-        else:
-            logger.error(f"Unknown workspace query action: {params.action}")
-            raise ValueError(f"Unknown workspace query action: {params.action}")
-        return {"status": "success", "action": params.action, "data": result}
+        action = params.action
+        fn = self._QUERY_ACTIONS.get(action)
+        if fn is None:
+            logger.error(f"Unknown workspace query action: {action}")
+            raise ValueError(f"Unknown workspace query action: {action}")
+        result = await fn(self, params)
+        return {"status": "success", "action": action, "data": result}
 
     @handle_errors
     async def _handle_modify_workspaces(self, params):
-        if not params.name and params.action in ["delete", "update", "switch"]:
-            logger.error(f"name is required for this {params.action} action")
-            raise ValueError(f"name is required for this {params.action} action")
-        
-        if not params.specs and params.action in ["create", "update"]:
-            logger.error(f"specs are required for this {params.action} action")
-            raise ValueError(f"specs are required for this {params.action} action")
-
-        if params.action == "create":
-            result = await self.workspace_services.create_workspace({k: v for k, v in params.specs.model_dump().items() if v is not None})
-        elif params.action == "delete":
-            result = await self.workspace_services.delete_workspace(params.name)
-        elif params.action == "update":
-            result = await self.workspace_services.update_workspace(params.name, {k: v for k, v in params.specs.model_dump().items() if v is not None})
-        elif params.action == "switch":
-            result = await self.workspace_services.switch_workspace(params.name)
-        else:
-            raise ValueError(f"Invalid action '{params.action}' for modify_workspaces")
-        return {"status": result["status"], "action": params.action, "message": result["message"]}
+        action = params.action
+        fn = self._MODIFY_ACTIONS.get(action)
+        if fn is None:
+            raise ValueError(f"Invalid action '{action}' for modify_workspaces")
+        result = await fn(self, params)
+        return {"status": result["status"], "action": action, "message": result["message"]}
@@ -1,13 +1,22 @@
 """
 Global logging configuration for P4 MCP server
 """
+import io
 import logging
 from logging.handlers import TimedRotatingFileHandler
 from pathlib import Path
 import sys
 import os
+import threading
+import time
 from typing import Optional
 
+# Project root: the executable's directory when frozen, else the repo root
+if getattr(sys, 'frozen', False):
+    _PROJECT_ROOT = Path(os.path.dirname(sys.executable))
+else:
+    _PROJECT_ROOT = Path(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
 class LoggingConfig:
     """Configuration constants for logging"""
     DEFAULT_LOG_LEVEL = "INFO"
@@ -16,12 +25,144 @@ class LoggingConfig:
     MAX_LOG_SIZE = 1024 * 1024 * 1024  # 1GB
     BACKUP_COUNT = 7
     ENCODING = "utf-8"
+    STREAM_BUFFER_SIZE = 64 * 1024  # Bytes buffered by the log file stream
+    BUFFER_FLUSH_LEVEL = logging.ERROR  # Records at/above this level flush immediately
+    CONSOLE_BUFFER_SIZE = 8192  # Bytes of console output held when stderr is not a terminal
+    CONSOLE_FLUSH_INTERVAL = 1.0  # Max seconds a console record waits in the buffer
+    FILE_FLUSH_INTERVAL = 1.0  # Max seconds a log file record waits in the stream buffer
     
     NOISY_LOGGERS = [
         'urllib3', 'requests', 'asyncio', 'P4', 
         'fastmcp', 'mcp.server.lowlevel.server'
     ]
 
+class BufferedTimedRotatingFileHandler(TimedRotatingFileHandler):
+    """TimedRotatingFileHandler writing through a 64KB buffered stream
+
+    Unlike ``StreamHandler`` it does not flush after every record; the stream
+    is flushed on rotation and close (both close the stream), on an explicit
+    ``flush()``, for records at or above ``flush_level``, and once unflushed
+    output is ``flush_interval`` seconds old (a daemon thread covers idle periods).
+    """
+
+    def __init__(self, *args, flush_level: int = logging.ERROR,
+                 flush_interval: float = LoggingConfig.FILE_FLUSH_INTERVAL, **kwargs):
+        self.flush_level = flush_level
+        self.flush_interval = flush_interval
+        self._dirty_since = None  # monotonic time of the oldest unflushed write
+        self._stop_flusher = threading.Event()
+        self._flusher = None
+        super().__init__(*args, **kwargs)
+
+    def _open(self):
+        raw = io.FileIO(self.baseFilename, 'a')
+        buffered = io.BufferedWriter(raw, buffer_size=LoggingConfig.STREAM_BUFFER_SIZE)
+        return io.TextIOWrapper(buffered, encoding=self.encoding, errors=self.errors, write_through=False)
+
+    def emit(self, record) -> None:
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            now = time.monotonic()
+            if self._dirty_since is None:
+                self._dirty_since = now
+            if record.levelno >= self.flush_level or now - self._dirty_since >= self.flush_interval:
+                self.stream.flush()
+                self._dirty_since = None
+            elif self._flusher is None:
+                self._flusher = threading.Thread(
+                    target=self._flush_loop, name="log-file-flusher", daemon=True
+                )
+                self._flusher.start()
+        except Exception:
+            self.handleError(record)
+
+    def _flush_loop(self) -> None:
+        """Flush output left unflushed past flush_interval until the handler closes"""
+        while not self._stop_flusher.wait(self.flush_interval):
+            if self._dirty_since is not None:
+                self.flush()
+
+    def flush(self) -> None:
+        with self.lock:
+            if self.stream and hasattr(self.stream, "flush"):
+                self.stream.flush()
+            self._dirty_since = None
+
+    def close(self) -> None:
+        self._stop_flusher.set()
+        super().close()
+
+class BufferedStreamHandler(logging.StreamHandler):
+    """StreamHandler that batches writes instead of flushing every record
+
+    Formatted records are held until ``buffer_size`` characters are pending,
+    a record at or above ``flush_level`` arrives, or the oldest pending record
+    is ``flush_interval`` seconds old, then written with one ``write()``. A
+    daemon thread enforces the age bound on an idle server; ``flush()`` (also
+    called by ``logging.shutdown``) drains it.
+    """
+
+    def __init__(self, stream=None, buffer_size: int = LoggingConfig.CONSOLE_BUFFER_SIZE,
+                 flush_level: int = logging.ERROR,
+                 flush_interval: float = LoggingConfig.CONSOLE_FLUSH_INTERVAL):
+        super().__init__(stream)
+        self.buffer_size = buffer_size
+        self.flush_level = flush_level
+        self.flush_interval = flush_interval
+        self._pending = []
+        self._pending_size = 0
+        self._oldest = 0.0  # monotonic time the first pending record arrived
+        self._stop_flusher = threading.Event()
+        self._flusher = None
+
+    def emit(self, record) -> None:
+        try:
+            msg = self.format(record) + self.terminator
+            now = time.monotonic()
+            if not self._pending:
+                self._oldest = now
+            self._pending.append(msg)
+            self._pending_size += len(msg)
+            if (self._pending_size >= self.buffer_size or record.levelno >= self.flush_level
+                    or now - self._oldest >= self.flush_interval):
+                self._write_pending()
+            elif self._flusher is None:
+                self._flusher = threading.Thread(
+                    target=self._flush_loop, name="console-log-flusher", daemon=True
+                )
+                self._flusher.start()
+        except Exception:
+            self.handleError(record)
+
+    def _flush_loop(self) -> None:
+        """Flush records left pending past flush_interval until the handler closes"""
+        while not self._stop_flusher.wait(self.flush_interval):
+            self.flush()
+
+    def _write_pending(self) -> None:
+        """Write pending output in one call; caller holds the handler lock"""
+        if self._pending:
+            self.stream.write("".join(self._pending))
+            self._pending.clear()
+            self._pending_size = 0
+        self.stream.flush()
+
+    def flush(self) -> None:
+        with self.lock:
+            if self.stream and hasattr(self.stream, "flush"):
+                self._write_pending()
+
+    def close(self) -> None:
+        self._stop_flusher.set()
+        super().close()
+
+# Numeric level for each accepted level name
+_LEVELS = {name: getattr(logging, name) for name in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")}
+
 class GlobalLogger:
     """Handles global application logging"""
     
@@ -42,9 +183,11 @@ class GlobalLogger:
         
         # Configure root logger
         root_logger = logging.getLogger()
+        for handler in root_logger.handlers:
+            handler.flush()  # Don't drop records still held in a buffer
         root_logger.handlers.clear()
         
-        numeric_level = getattr(logging, log_level.upper(), logging.INFO)
+        numeric_level = _LEVELS.get(log_level.upper(), logging.INFO)
         root_logger.setLevel(numeric_level)
         
         # Setup global logging handlers
@@ -70,25 +213,36 @@ class GlobalLogger:
         # Create logs directory and add rotating file handler   
         try:
             logs_dir.mkdir(exist_ok=True)
-            global_handler = TimedRotatingFileHandler(
+            global_handler = BufferedTimedRotatingFileHandler(
                 log_file_path,
                 when=LoggingConfig.WHEN,
                 interval=LoggingConfig.DAY_INTERVAL,
                 backupCount=LoggingConfig.BACKUP_COUNT,
-                encoding=LoggingConfig.ENCODING
+                encoding=LoggingConfig.ENCODING,
+                flush_level=LoggingConfig.BUFFER_FLUSH_LEVEL
             )
+            # The handler's stream buffer batches writes and bounds their age;
+            # logging.shutdown() flushes it at exit
             self._add_handler(root_logger, global_handler, global_formatter)
         except Exception as e:
             print(f"Warning: Failed to create global log file {log_file_path}: {e}", file=sys.stderr)
         
-        # Add console handler for global logs
+        # Add console handler for global logs; buffer it unless a person is watching
         console_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-        self._add_handler(root_logger, logging.StreamHandler(sys.stderr), console_formatter)
+        if sys.stderr.isatty():
+            console_handler = logging.StreamHandler(sys.stderr)
+        else:
+            console_handler = BufferedStreamHandler(sys.stderr, flush_level=LoggingConfig.BUFFER_FLUSH_LEVEL)
+        self._add_handler(root_logger, console_handler, console_formatter)
     
     def _suppress_noisy_loggers(self) -> None:
         """Suppress commonly noisy third-party loggers"""
-        for logger_name in LoggingConfig.NOISY_LOGGERS:
-            logging.getLogger(logger_name).setLevel(logging.WARNING)
+        # Hold the (re-entrant) module lock once for the whole batch instead of
+        # acquiring it per getLogger/setLevel call
+        with logging._lock:
+            manager = logging.Logger.manager
+            for logger_name in LoggingConfig.NOISY_LOGGERS:
+                manager.getLogger(logger_name).setLevel(logging.WARNING)
     
     def _add_handler(self, logger: logging.Logger, handler: logging.Handler, formatter: logging.Formatter) -> None:
         """Helper function to configure and add a handler to the logger"""
@@ -104,9 +258,7 @@ class GlobalLogger:
     @staticmethod
     def _get_project_root() -> Path:
         """Get project root directory"""
-        if getattr(sys, 'frozen', False):
-            return Path(os.path.dirname(sys.executable))
-        return Path(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+        return _PROJECT_ROOT
 
 # Global instance
 _global_logger = GlobalLogger()
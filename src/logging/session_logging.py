@@ -1,21 +1,43 @@
 """
 Session logging configuration for P4 MCP server telemetry
 """
+import atexit
 import logging
-from logging.handlers import TimedRotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 import sys
 import os
 import uuid
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any
 import threading
 import json
 import platform
-import requests
+from src.logging.global_logging import BufferedTimedRotatingFileHandler
 from src.telemetry.upload_logs import upload_logs
 
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the stdlib encoder
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Project root: the executable's directory when frozen, else the repo root
+if getattr(sys, 'frozen', False):
+    _PROJECT_ROOT = Path(os.path.dirname(sys.executable))
+else:
+    _PROJECT_ROOT = Path(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+_SESSIONS_DIR = _PROJECT_ROOT / 'logs' / 'sessions'
+
+def _dumps(obj: Any) -> str:
+    """Serialize to a compact JSON string, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj)
+
 class SessionConfig:
     """Configuration constants for session logging"""
     REQUEST_TIMEOUT = 5
@@ -25,6 +47,114 @@ class SessionConfig:
     MAX_LOG_SIZE = 100 * 1024 * 1024  # 100MB
     BACKUP_COUNT = 7
     ENCODING = "utf-8"
+    BATCH_SIZE = 100  # Records buffered before a session log write
+    FLUSH_INTERVAL = 1.0  # Max seconds a record waits in the buffer
+    UPLOAD_WORKERS = 2
+    UPLOAD_ATTEMPTS = 3  # Retries back off 1s, 2s, ...
+    SHARED_LOG_FILE = "telemetry.log"
+    HANDOFF_TIMEOUT = 10.0  # Max seconds an upload waits for its log to be handed off
+
+class BatchingFileHandler(BufferedTimedRotatingFileHandler):
+    """Rotating file handler that buffers formatted records and writes them in batches
+
+    Records are written with a single ``write()`` once ``batch_size`` records
+    are pending or ``flush_interval`` seconds have passed since the last write,
+    and on ``flush()``/``close()``. A daemon thread, idle while nothing is
+    pending, writes records that would otherwise wait for the next one.
+    """
+
+    def __init__(self, *args, batch_size: int = SessionConfig.BATCH_SIZE,
+                 flush_interval: float = SessionConfig.FLUSH_INTERVAL, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pending = []
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._last_write = time.monotonic()
+        self._has_pending = threading.Event()
+
+    def emit(self, record) -> None:
+        try:
+            if self.shouldRollover(record):
+                self._write_pending()
+                self.doRollover()
+            self._pending.append(self.format(record))
+            if (len(self._pending) >= self._batch_size or
+                    time.monotonic() - self._last_write >= self._flush_interval):
+                self._write_pending()
+            elif not self._has_pending.is_set():
+                self._has_pending.set()
+                if self._flusher is None:
+                    self._flusher = threading.Thread(
+                        target=self._flush_loop, name="session-log-flusher", daemon=True
+                    )
+                    self._flusher.start()
+        except Exception:
+            self.handleError(record)
+
+    def _flush_loop(self) -> None:
+        """Write pending records flush_interval after they arrive; sleeps while none are pending"""
+        while True:
+            self._has_pending.wait()
+            if self._stop_flusher.wait(self._flush_interval):
+                return
+            self.flush()
+
+    def _write_pending(self) -> None:
+        """Write all pending lines with one call; caller holds the handler lock"""
+        if self._pending:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.terminator.join(self._pending) + self.terminator)
+            self.stream.flush()
+            self._pending.clear()
+        self._has_pending.clear()
+        self._last_write = time.monotonic()
+
+    def flush(self) -> None:
+        with self.lock:
+            self._write_pending()
+
+    def close(self) -> None:
+        self.flush()
+        self._stop_flusher.set()
+        self._has_pending.set()  # wake the flusher so it sees the stop
+        super().close()
+
+class SessionLogHandler(BatchingFileHandler):
+    """Batching handler for the shared session log
+
+    A record carrying a ``handoff_to`` path (see ``SessionManager``) is not
+    written; instead the current file is moved to that path so it can be
+    uploaded, and the next record reopens a fresh shared file.
+    """
+
+    def emit(self, record) -> None:
+        handoff_to = getattr(record, "handoff_to", None)
+        if handoff_to is None:
+            super().emit(record)
+            return
+        try:
+            self._write_pending()
+            if self.stream is not None:
+                self.stream.close()
+                self.stream = None
+            if os.path.exists(self.baseFilename):
+                os.replace(self.baseFilename, handoff_to)
+        except Exception:
+            self.handleError(record)
+        finally:
+            record.handoff_done.set()
+
+class _SessionIdFilter(logging.Filter):
+    """Stamp records with the session they were logged under"""
+
+    def __init__(self, session_id: str):
+        super().__init__()
+        self.session_id = session_id
+
+    def filter(self, record) -> bool:
+        record.session_id = self.session_id
+        return True
 
 class SessionManager:
     """Manages session state and telemetry logging"""
@@ -34,6 +164,35 @@ class SessionManager:
         self._session_loggers: Dict[str, logging.Logger] = {}
         self._lock = threading.Lock()
         self._user_details: Optional[Dict[str, Any]] = None
+        self._upload_pool = ThreadPoolExecutor(
+            max_workers=SessionConfig.UPLOAD_WORKERS, thread_name_prefix="session-upload"
+        )
+
+        # Create session log directory once, outside the start_session critical section
+        self._sessions_dir = _SESSIONS_DIR
+        try:
+            self._sessions_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            logger.warning("Could not create session log directory %s: %s", self._sessions_dir, e)
+
+        # One handler, formatter and writer thread shared by every session;
+        # the file is opened lazily on the first record
+        self._shared_handler = SessionLogHandler(
+            self._sessions_dir / SessionConfig.SHARED_LOG_FILE,
+            when=SessionConfig.WHEN,
+            interval=SessionConfig.DAY_INTERVAL,
+            backupCount=SessionConfig.BACKUP_COUNT,
+            encoding=SessionConfig.ENCODING,
+            delay=True
+        )
+        self._shared_handler.setFormatter(SessionJsonFormatter(self))
+        self._shared_queue = queue.SimpleQueue()
+        self._shared_listener = QueueListener(
+            self._shared_queue, self._shared_handler, respect_handler_level=False
+        )
+        self._shared_queue_handler = QueueHandler(self._shared_queue)
+        self._listener_started = False
+        self._handoffs: Dict[str, threading.Event] = {}
     
     @property
     def current_session_id(self) -> Optional[str]:
@@ -64,88 +223,123 @@ class SessionManager:
     
     def start_session(self, session_id: Optional[str] = None) -> str:
         """Start a new session with proper cleanup"""
-        with self._lock:
-            if session_id is None:
-                session_id = uuid.uuid4().hex[:16]
-            
-            # End existing session if any
-            if self._current_session_id:
-                self._end_session_internal(self._current_session_id)
-            
-            self._current_session_id = session_id
-            
-            try:
-                self._create_session_logger(session_id)
-                logger.info(f"Session started: {session_id}")
-            except Exception as e:
-                logger().error(f"Failed to start session {session_id}: {e}")
-                raise
-            
-            return session_id
+        ended_session_id = None
+        try:
+            with self._lock:
+                if session_id is None:
+                    session_id = uuid.uuid4().hex[:16]
+
+                # End existing session if any
+                if self._current_session_id:
+                    ended_session_id = self._end_session_internal(self._current_session_id)
+
+                self._current_session_id = session_id
+
+                try:
+                    self._create_session_logger(session_id)
+                    logger.info("Session started: %s", session_id)
+                except Exception as e:
+                    logger.error("Failed to start session %s: %s", session_id, e)
+                    raise
+
+                return session_id
+        finally:
+            # Upload the previous session's log outside the lock
+            if ended_session_id:
+                self._schedule_upload(ended_session_id)
     
     def _create_session_logger(self, session_id: str) -> None:
         """Create session-specific logger for telemetry data only"""
         session_logger = logging.getLogger(f"session.{session_id}")
         session_logger.handlers.clear()
+        session_logger.filters.clear()
         session_logger.setLevel(logging.INFO)
         session_logger.propagate = False  # Don't propagate to global logger
-        
-        # Create session log directory and file
-        project_root = self._get_project_root()
-        sessions_dir = project_root / 'logs' / 'sessions'
-        sessions_dir.mkdir(parents=True, exist_ok=True)
-        
-        session_log_file = sessions_dir / f"{session_id}.log"
-        session_formatter = SessionJsonFormatter(session_id, self)
-
-        session_handler = TimedRotatingFileHandler(
-            session_log_file, 
-            when=SessionConfig.WHEN, 
-            interval=SessionConfig.DAY_INTERVAL, 
-            backupCount=SessionConfig.BACKUP_COUNT, 
-            encoding=SessionConfig.ENCODING
-        )
-        session_handler.setFormatter(session_formatter)
-        session_logger.addHandler(session_handler)
+
+
+        if not self._listener_started:
+            self._shared_listener.start()
+            self._listener_started = True
+            atexit.register(self._close_all)
+
+        # The caller only enqueues; the shared listener thread formats and writes
+        session_logger.addFilter(_SessionIdFilter(session_id))
+        session_logger.addHandler(self._shared_queue_handler)
         
         self._session_loggers[session_id] = session_logger
     
+    def _close_all(self) -> None:
+        """Drain the shared queue and close the session log at process exit"""
+        if self._listener_started:
+            self._shared_listener.stop()
+            self._listener_started = False
+        self._shared_handler.close()
+
     def end_session(self, session_id: Optional[str] = None) -> None:
         """End session with proper cleanup"""
+        ended_session_id = None
         with self._lock:
             target_session_id = session_id or self._current_session_id
             if target_session_id:
-                self._end_session_internal(target_session_id)
+                ended_session_id = self._end_session_internal(target_session_id)
+        if ended_session_id:
+            self._schedule_upload(ended_session_id)
     
-    def _end_session_internal(self, session_id: str) -> None:
-        """Internal session cleanup"""
+    def _end_session_internal(self, session_id: str) -> Optional[str]:
+        """Internal session cleanup; returns the ended session ID so the caller can upload its log"""
         if session_id in self._session_loggers:
-            session_logger = self._session_loggers[session_id]
-            
-            # Close handlers
-            for handler in session_logger.handlers[:]:
-                handler.close()
-                session_logger.removeHandler(handler)
-            
-            del self._session_loggers[session_id]
-            
-            # Upload session log
-            try:
-                self._upload_session_log(session_id)
-            except Exception as e:
-                logger.error(f"Failed to upload session log {session_id}: {e}")
+            session_logger = self._session_loggers.pop(session_id)
+
+            # Detach from the shared queue; records already queued are still written
+            session_logger.removeHandler(self._shared_queue_handler)
+            session_logger.filters.clear()
+
+            # Queue a marker behind this session's records so the writer thread
+            # moves the shared file to <session_id>.log once they are written
+            handoff = logging.makeLogRecord({
+                "handoff_to": str(self._sessions_dir / f"{session_id}.log"),
+                "handoff_done": threading.Event(),
+            })
+            self._handoffs[session_id] = handoff.handoff_done
+            self._shared_queue.put(handoff)
 
-            logger.info(f"Session ended: {session_id}")
+            logger.info("Session ended: %s", session_id)
 
             if session_id == self._current_session_id:
                 self._current_session_id = None
-    
-    def _upload_session_log(self, session_id: str) -> None:
+            return session_id
+        return None
+
+    def _schedule_upload(self, session_id: str) -> None:
+        """Upload a finished session's log on the background pool"""
+        try:
+            self._upload_pool.submit(self._upload_with_retry, session_id)
+        except RuntimeError:
+            # Pool already shut down (interpreter exit); upload inline instead
+            self._upload_with_retry(session_id)
+
+    def _upload_with_retry(self, session_id: str) -> None:
+        """Upload session log, retrying with exponential backoff"""
+        handoff_done = self._handoffs.pop(session_id, None)
+        if handoff_done is not None and not handoff_done.wait(SessionConfig.HANDOFF_TIMEOUT):
+            logger.warning("Session log for %s was not handed off in time", session_id)
+        for attempt in range(SessionConfig.UPLOAD_ATTEMPTS):
+            try:
+                if self._upload_session_log(session_id):
+                    return
+            except Exception as e:
+                logger.error("Failed to upload session log %s: %s", session_id, e)
+            if attempt + 1 < SessionConfig.UPLOAD_ATTEMPTS:
+                time.sleep(2 ** attempt)
+        logger.error("Giving up on session log upload %s after %d attempts",
+                     session_id, SessionConfig.UPLOAD_ATTEMPTS)
+
+    def _upload_session_log(self, session_id: str) -> bool:
         """Upload session log file"""
-        project_root = self._get_project_root()
-        log_file = project_root / 'logs' / 'sessions' / f"{session_id}.log"
+        log_file = self._sessions_dir / f"{session_id}.log"
         if log_file.exists():
-            upload_logs(str(log_file))
+            return upload_logs(str(log_file))
+        return True
 
     def get_session_logger(self, session_id: Optional[str] = None) -> Optional[logging.Logger]:
         """Get session-specific logger (returns None if no session)"""
@@ -158,9 +352,12 @@ class SessionManager:
         """Log tool call data to session log only"""
         session_logger = self.get_session_logger(session_id)
         if not session_logger:
-            logger.warning(f"No active session for tool call logging: {tool_data.get('tool_name', 'unknown')}")
+            logger.warning("No active session for tool call logging: %s", tool_data.get('tool_name', 'unknown'))
             return
-        
+
+        if not session_logger.isEnabledFor(logging.INFO):
+            return
+
         # Ensure tool_data has expected structure
         formatted_tool_call = {
             "mcp_client": tool_data.get("mcp_client", "unknown"),
@@ -171,40 +368,53 @@ class SessionManager:
             "p4_version": tool_data.get("p4_version", "unknown")
         }
         
-        session_logger.info(json.dumps(formatted_tool_call))
+        # Tagged so the formatter splices the JSON in without re-parsing it
+        session_logger.info(_dumps(formatted_tool_call), extra={'_is_json': True})
     
     @staticmethod
     def _get_project_root() -> Path:
         """Get project root directory"""
-        if getattr(sys, 'frozen', False):
-            return Path(os.path.dirname(sys.executable))
-        return Path(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+        return _PROJECT_ROOT
 
 class SessionJsonFormatter(logging.Formatter):
     """Custom JSON formatter for session logs only"""
     
-    def __init__(self, session_id: str, session_manager: SessionManager):
+    def __init__(self, session_manager: "SessionManager"):
         super().__init__()
-        self.session_id = session_id
         self.session_manager = session_manager
-    
+        self._user_suffix: Optional[str] = None
+        self._session_prefixes: Dict[Optional[str], str] = {}
+
+    def _prefix(self, session_id: Optional[str]) -> str:
+        """Serialized '{"session_id": ..., "timestamp": "' head, cached per session"""
+        prefix = self._session_prefixes.get(session_id)
+        if prefix is None:
+            prefix = '{"session_id": ' + _dumps(session_id) + ', "timestamp": "'
+            self._session_prefixes = {session_id: prefix}  # Only the live session is kept
+        return prefix
+
     def format(self, record) -> str:
         """Format log record as JSON for session telemetry"""
         try:
-            # Try to parse message as JSON first (for tool calls)
             message = record.getMessage()
-            try:
-                tool_call = json.loads(message)
-            except json.JSONDecodeError:
-                tool_call = message
-            
-            log_entry = {
-                "session_id": self.session_id,
-                "timestamp": self.formatTime(record, "%Y-%m-%d %H:%M:%S"),
-                "tool_call": tool_call,
-                "user": self.session_manager.get_user_details()
-            }
-            return json.dumps(log_entry)
+            if getattr(record, '_is_json', False):
+                # Tool calls arrive already serialized
+                tool_call_json = message
+            else:
+                # Try to parse message as JSON first, else log it as a string
+                try:
+                    tool_call_json = _dumps(json.loads(message))
+                except json.JSONDecodeError:
+                    tool_call_json = _dumps(message)
+
+            # The user block never changes, so serialize it once on first use
+            if self._user_suffix is None:
+                self._user_suffix = ', "user": ' + _dumps(self.session_manager.get_user_details()) + '}'
+
+            return (self._prefix(getattr(record, "session_id", None)) +
+                    self.formatTime(record, "%Y-%m-%d %H:%M:%S") +
+                    '", "tool_call": ' + tool_call_json +
+                    self._user_suffix)
         except Exception as e:
             # Fallback to simple string format if JSON formatting fails
             return f"JSON_FORMAT_ERROR: {record.getMessage()} | Error: {e}"
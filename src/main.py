@@ -81,7 +81,6 @@ def parse_args() -> argparse.Namespace:
 
 def signal_handler(signum, frame):
     """Handle shutdown signals gracefully."""
-    logger = logging.getLogger(__name__)
     logger.info("Received shutdown signal, stopping server...")
     sys.exit(0)
 
@@ -113,13 +112,13 @@ def main() -> None:
             ssl_verify=ssl_verify,
         )
         if args.transport == "http":
-            logger.info(f"Starting P4 MCP Server with HTTP transport on port {args.port}")
+            logger.info("Starting P4 MCP Server with HTTP transport on port %s", args.port)
             server.run(transport="http", port=args.port, host="0.0.0.0")
         else:
             logger.info("Starting P4 MCP Server with stdio transport")
             server.run()
     except Exception as e:
-        logger.error(f"An error occurred while starting the server: {e}")
+        logger.error("An error occurred while starting the server: %s", e)
         logger.debug("Traceback:", exc_info=True)
         sys.exit(1)
     finally:
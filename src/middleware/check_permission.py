@@ -1,11 +1,25 @@
 from fastmcp.server.middleware import Middleware, MiddlewareContext
 from fastmcp.exceptions import ToolError
+import asyncio
+import functools
 import logging
 from ..core.connection import P4ConnectionManager
 import time
 
 logger = logging.getLogger(__name__)
 
+_OP_TAGS = frozenset({'read', 'write', 'delete'})
+_WRITE_OPS = frozenset({'write', 'delete'})
+_TOOLSET_TAGS = frozenset({'server', 'files', 'workspaces', 'changelists', 'shelves', 'jobs', 'reviews', 'streams'})
+
+
+
+@functools.lru_cache(maxsize=256)
+def _csv_set(value: str) -> frozenset:
+    """Parse a comma-separated property value into a set, once per distinct value"""
+    return frozenset(item.strip() for item in value.split(","))
+
+
 class CheckPermissionMiddleware(Middleware):
     """Middleware to check tool permissions based on P4 properties"""
 
@@ -15,6 +29,10 @@ class CheckPermissionMiddleware(Middleware):
         self._property_cache = {}
         self._cache_timeout = 60  # 1 minute
         self._last_cache_update = 0
+        self._refresher_task = None
+        self._refresh_lock = None  # asyncio.Lock, created on first use inside the event loop
+        self._refresh_generation = 0
+        self._tool_info = {}  # tool name -> parsed tool_info; tool tags are fixed at registration
 
     def _parse_tool_info_from_tags(self, tool_name: str, tags: list) -> dict:
         """Extract tool information from tags instead of parsing tool name"""
@@ -26,13 +44,18 @@ class CheckPermissionMiddleware(Middleware):
         }
 
         # Extract operation type and toolset from tags
+        found_op = found_toolset = False
         for tag in tags:
-            if tag in ['read', 'write', 'delete']:
+            if tag in _OP_TAGS:
                 tool_info['operation_type'] = tag
-                tool_info['is_write_operation'] = tag in ['write', 'delete']
+                tool_info['is_write_operation'] = tag in _WRITE_OPS
                 tool_info['is_delete_operation'] = tag == 'delete'
-            elif tag in ['server', 'files', 'workspaces', 'changelists', 'shelves', 'jobs', 'reviews', 'streams']:
+                found_op = True
+            elif tag in _TOOLSET_TAGS:
                 tool_info['toolset'] = tag
+                found_toolset = True
+            if found_op and found_toolset:
+                break
 
         # Fallback to parsing tool name if tags don't provide enough info
         if tool_info['toolset'] == 'unknown' and '_' in tool_name:
@@ -41,76 +64,94 @@ class CheckPermissionMiddleware(Middleware):
         return tool_info
 
     async def _refresh_properties_cache(self):
-        """Fetch all properties and cache them"""
-        current_time = time.time()
-        if (self._property_cache and
-            current_time - self._last_cache_update < self._cache_timeout):
-            return  # Cache is still valid
-
-        try:
-            async with self.connection_manager.get_connection() as p4:
-                if not p4:
-                    self._property_cache = {}
-                    return
-                result = p4.run("property", "-l")
-                # Build a dict: {property_name: value}
-                self._property_cache = {prop['name']: prop.get('value', '').strip() for prop in result}
-                self._last_cache_update = current_time
-        except Exception as e:
-            logger.warning(f"Failed to refresh property cache: {e}")
-            self._property_cache = {}
-
-    async def _get_property_value(self, property_name):
-        """Get property value from cached properties"""
-        await self._refresh_properties_cache()
-        return self._property_cache.get(property_name)
-
-    async def _check_global_permissions(self, tool_info: dict):
+        """Fetch all properties and cache them; concurrent callers share one fetch"""
+        if self._refresh_lock is None:
+            self._refresh_lock = asyncio.Lock()
+        generation = self._refresh_generation
+        async with self._refresh_lock:
+            if self._refresh_generation != generation:
+                return  # Another coroutine refreshed while we waited
+            self._refresh_generation += 1
+            try:
+                async with self.connection_manager.get_connection() as p4:
+                    if not p4:
+                        return
+                    result = p4.run("property", "-l")
+                    # Build a dict: {property_name: value}
+                    self._property_cache = {prop['name']: prop.get('value', '').strip() for prop in result}
+                    self._last_cache_update = time.time()
+            except Exception as e:
+                # Keep serving the last known properties rather than none at all
+                logger.warning("Failed to refresh property cache: %s", e)
+
+    async def _start_refresher(self):
+        """Refresh the property cache every ``_cache_timeout`` seconds"""
+        while True:
+            await asyncio.sleep(self._cache_timeout)
+            await self._refresh_properties_cache()
+
+    async def _ensure_refresher(self):
+        """Fill the property cache and, once that succeeds, start the background refresher"""
+        if not self._last_cache_update:
+            # Concurrent callers share one fetch; retry on every call until a fill succeeds
+            await self._refresh_properties_cache()
+            if not self._last_cache_update:
+                return
+        if self._refresher_task is None:
+            self._refresher_task = asyncio.create_task(self._start_refresher())
+
+    def _check_global_permissions(self, cache: dict, tool_info: dict):
         """Check global MCP permissions based on operation type from tags"""
-        mcp_enabled = await self._get_property_value("mcp.enabled")
+        mcp_enabled = cache.get("mcp.enabled")
         if mcp_enabled is not None and mcp_enabled.lower() == "false":
             raise ToolError("P4 MCP server is disabled by the administrator")
 
         if tool_info['is_write_operation']:
-            global_write = await self._get_property_value("mcp.toolsets.write")
+            global_write = cache.get("mcp.toolsets.write")
             if global_write is not None and global_write.lower() == "false":
                 raise ToolError("Write operations are disabled by the administrator")
 
         return True
 
-    async def _check_toolset_permissions(self, tool_info: dict):
+    def _check_toolset_permissions(self, cache: dict, tool_info: dict):
         """Check toolset-specific permissions using tag-based toolset"""
         toolset = tool_info['toolset']
 
-        allowed_toolsets = await self._get_property_value("mcp.toolsets.allowed")
+        allowed_toolsets = cache.get("mcp.toolsets.allowed")
         if allowed_toolsets:
-            allowed_list = [ts.strip() for ts in allowed_toolsets.split(",")]
-            if toolset not in allowed_list:
+            if toolset not in _csv_set(allowed_toolsets):
                 raise ToolError(f"Toolset '{toolset}' is disabled by the administrator")
 
-        toolset_enabled = await self._get_property_value(f"mcp.toolset.{toolset}.enabled")
+        toolset_enabled = cache.get(f"mcp.toolset.{toolset}.enabled")
         if toolset_enabled is not None and toolset_enabled.lower() == "false":
             raise ToolError(f"Toolset '{toolset}' is disabled by the administrator")
 
         if tool_info['is_write_operation']:
-            toolset_write = await self._get_property_value(f"mcp.toolset.{toolset}.write")
+            toolset_write = cache.get(f"mcp.toolset.{toolset}.write")
             if toolset_write is not None and toolset_write.lower() == "false":
                 raise ToolError(f"Write operations disabled for toolset '{toolset}' by the administrator")
 
         return True
 
-    async def _check_tool_permissions(self, tool_name, tool_info: dict):
+    def _check_tool_permissions(self, cache: dict, tool_name, tool_info: dict):
         """Check specific tool permissions using tag-based toolset"""
         toolset = tool_info['toolset']
 
-        allowed_tools = await self._get_property_value(f"mcp.toolset.{toolset}.tools")
+        allowed_tools = cache.get(f"mcp.toolset.{toolset}.tools")
         if allowed_tools:
-            allowed_list = [tool.strip() for tool in allowed_tools.split(",")]
-            if tool_name not in allowed_list:
+            if tool_name not in _csv_set(allowed_tools):
                 raise ToolError(f"Tool '{tool_name}' is disabled by the administrator")
 
         return True
 
+    def _evaluate_permissions(self, tool_info: dict, tool_name):
+        """Run global, toolset and tool checks against one snapshot of the cache"""
+        cache = self._property_cache
+        self._check_global_permissions(cache, tool_info)
+        self._check_toolset_permissions(cache, tool_info)
+        self._check_tool_permissions(cache, tool_name, tool_info)
+        return True
+
     async def on_call_tool(self, context: MiddlewareContext, call_next):
         """Check permissions before executing a tool"""
         if context.fastmcp_context:
@@ -118,26 +159,23 @@ class CheckPermissionMiddleware(Middleware):
                 if not self.connection_manager:
                     raise ToolError("P4 connection manager not initialized")
 
-                tool = await context.fastmcp_context.fastmcp.get_tool(context.message.name)
-                tool_name = context.message.name
-
-                # Parse tool information from tags
-                tool_info = self._parse_tool_info_from_tags(tool_name, tool.tags)
-
-                # Check global permissions
-                await self._check_global_permissions(tool_info)
+                await self._ensure_refresher()
 
-                # Check toolset permissions
-                await self._check_toolset_permissions(tool_info)
+                tool_name = context.message.name
+                tool_info = self._tool_info.get(tool_name)
+                if tool_info is None:
+                    tool = await context.fastmcp_context.fastmcp.get_tool(tool_name)
+                    # Parse tool information from tags
+                    tool_info = self._tool_info[tool_name] = self._parse_tool_info_from_tags(tool_name, tool.tags)
 
-                # Check tool-specific permissions
-                await self._check_tool_permissions(tool_name, tool_info)
+                # Check global, toolset and tool-specific permissions
+                self._evaluate_permissions(tool_info, tool_name)
 
-                logger.info(f"Permission check passed for {tool_name} "
-                            f"({tool_info['operation_type']} on {tool_info['toolset']})")
+                logger.info("Permission check passed for %s (%s on %s)",
+                            tool_name, tool_info['operation_type'], tool_info['toolset'])
 
             except Exception as e:
-                logger.error(f"Permission check failed: {e}")
+                logger.error("Permission check failed: %s", e)
                 raise ToolError(f"Permission denied: {str(e)}")
 
         return await call_next(context)
\ No newline at end of file
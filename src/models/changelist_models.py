@@ -1,9 +1,9 @@
 """Changelist query and modify models."""
 
-from typing import Optional, List
+from typing import List, Optional
 from enum import Enum
 from pydantic import Field, model_validator
-from .common import BaseParams, PaginatedParams
+from .common import BaseParams, PaginatedParams, ChangelistIdOpt, WorkspaceNameOpt, FilePathsOpt, UserFilterOpt
 
 
 class ChangelistStatus(str, Enum):
@@ -24,82 +24,94 @@ class ChangelistModifyAction(str, Enum):
     MOVE_FILES = "move_files"
 
 
+def _require_changelist_id(p) -> None:
+    if not p.changelist_id:
+        raise ValueError(f'changelist_id is required for action: {p.action}')
+
+
+def _check_create(p) -> None:
+    if not p.description:
+        raise ValueError('description is required for create action')
+
+
+def _check_update(p) -> None:
+    _require_changelist_id(p)
+    if not p.description:
+        raise ValueError('description is required for update action')
+
+
+def _check_move_files(p) -> None:
+    _require_changelist_id(p)
+    if not p.file_paths:
+        raise ValueError('file_paths is required for move_files action')
+
+
+# Per-action validation for ModifyChangelistsParams; actions not listed require
+# changelist_id. Keyed by enum value since BaseParams stores values (use_enum_values)
+_MODIFY_CHANGELIST_RULES = {
+    ChangelistModifyAction.CREATE.value: _check_create,
+    ChangelistModifyAction.UPDATE.value: _check_update,
+    ChangelistModifyAction.MOVE_FILES.value: _check_move_files,
+}
+
+
 class QueryChangelistsParams(PaginatedParams):
     """Changelist query parameters."""
     action: ChangelistAction = Field(
         description="Changelist query action",
-        examples=["get", "list"]
+        examples=("get", "list")
     )
-    changelist_id: Optional[str] = Field(
-        default=None,
+    changelist_id: ChangelistIdOpt = Field(
         description="Changelist ID - required for get action",
-        examples=["12345", "default"]
-    )
-    workspace_name: Optional[str] = Field(
-        default=None,
-        description="Filter by workspace - for list action",
-        examples=["my_workspace"]
+        examples=("12345", "default")
     )
-    user: Optional[str] = Field(
-        default=None,
-        description="Filter by user - for list action",
-        examples=["alice"]
+    workspace_name: WorkspaceNameOpt = Field(
+        description="Filter by workspace - for list action"
     )
+    user: UserFilterOpt
     status: Optional[ChangelistStatus] = Field(
         default=None,
         description="Filter by status - for list action",
-        examples=["pending", "submitted"]
+        examples=("pending", "submitted")
     )
     depot_path: Optional[str] = Field(
         default=None,
         description="Filter by depot path - for list action",
-        examples=["//depot/my_workspace/..."]
+        examples=("//depot/my_workspace/...",)
+    )
+    fields: Optional[List[str]] = Field(
+        default=None,
+        description="Fields to return for list action (e.g. ['change', 'user', 'status', 'desc'])",
+        examples=(["change", "user", "client", "status", "desc"],)
     )
 
-    @model_validator(mode='after')
-    def validate_changelist_id_required(self):
-        """Validate changelist_id is provided when required."""
-        if self.action == ChangelistAction.GET and not self.changelist_id:
-            raise ValueError('changelist_id is required for get action')
-        return self
+    _RULES = (
+        (frozenset({ChangelistAction.GET.value}), 'changelist_id', 'changelist_id is required for get action'),
+    )
 
 
 class ModifyChangelistsParams(BaseParams):
     """Changelist modification parameters."""
     action: ChangelistModifyAction = Field(
         description="Changelist modification action",
-        examples=["create", "update", "submit", "delete", "move_files"]
+        examples=("create", "update", "submit", "delete", "move_files")
     )
-    changelist_id: Optional[str] = Field(
-        default=None,
-        description="Changelist ID - required for most actions except create",
-        examples=["12345"]
+    changelist_id: ChangelistIdOpt = Field(
+        description="Changelist ID - required for most actions except create"
     )
     description: Optional[str] = Field(
         default="",
         max_length=2000,
         description="Changelist description - required for create, optional for update",
-        examples=["Fix bug in authentication module", "Add new feature X"]
+        examples=("Fix bug in authentication module", "Add new feature X")
     )
-    file_paths: Optional[List[str]] = Field(
-        default=None,
-        description="File paths - required for move_files action to a specific changelist",
-        examples=[["//depot/projectX/file1.txt"]]
+    file_paths: FilePathsOpt = Field(
+        description="File paths - required for move_files action to a specific changelist"
     )
 
     @model_validator(mode='after')
     def validate_changelist_params(self):
         """Validate parameters based on action type."""
         # Most actions require changelist_id except create
-        if self.action != ChangelistModifyAction.CREATE and not self.changelist_id:
-            raise ValueError(f'changelist_id is required for action: {self.action}')
-
-        # Create requires description
-        if self.action == ChangelistModifyAction.CREATE and not self.description:
-            raise ValueError('description is required for create action')
-
-        # Move files requires file_paths
-        if self.action == ChangelistModifyAction.MOVE_FILES and not self.file_paths:
-            raise ValueError('file_paths is required for move_files action')
-
+        _MODIFY_CHANGELIST_RULES.get(self.action, _require_changelist_id)(self)
         return self
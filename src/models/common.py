@@ -1,6 +1,8 @@
 """Base models and shared enums used across all resource-specific model modules."""
 
-from pydantic import BaseModel, Field, ConfigDict
+import functools
+from typing import Annotated, ClassVar, Optional, List
+from pydantic import BaseModel, Field, ConfigDict, model_validator
 from enum import Enum
 
 
@@ -17,6 +19,27 @@ class ResolveMode(str, Enum):
     YOURS = "yours"     # -ay
 
 
+# =============================================================================
+# SHARED FIELD TYPES
+# =============================================================================
+# Example values repeated across resource models
+CHANGELIST_ID_EXAMPLES = ("12345",)
+WORKSPACE_NAME_EXAMPLES = ("my_workspace",)
+BOOL_EXAMPLES = (False, True)
+
+# Optional fields repeated across resource models. Classes add their own
+# action-specific description with ``= Field(description=...)``.
+
+ChangelistIdOpt = Annotated[Optional[str], Field(default=None, examples=CHANGELIST_ID_EXAMPLES)]
+WorkspaceNameOpt = Annotated[Optional[str], Field(default=None, examples=WORKSPACE_NAME_EXAMPLES)]
+FilePathsOpt = Annotated[Optional[List[str]], Field(default=None, examples=(["//depot/projectX/file1.txt"],))]
+UserFilterOpt = Annotated[Optional[str], Field(
+    default=None,
+    description="Filter by user - for list action",
+    examples=("alice",)
+)]
+
+
 # =============================================================================
 # BASE MODELS WITH COMMON PATTERNS
 # =============================================================================
@@ -25,11 +48,39 @@ class BaseParams(BaseModel):
     """Base class for all parameter models with common configuration."""
     model_config = ConfigDict(
         str_strip_whitespace=True,
-        validate_assignment=True,
         extra='forbid',
-        use_enum_values=True
+        use_enum_values=True,
+        frozen=True
     )
 
+    # (actions, field, message) rules: ``field`` must be set when ``action`` is
+    # in ``actions``; ``message`` may use ``{action}``
+    _RULES: ClassVar[tuple] = ()
+
+    @model_validator(mode='after')
+    def validate_required_by_action(self):
+        """Validate action-dependent required fields declared in ``_RULES``."""
+        if self._RULES:
+            action = getattr(self, 'action', None)
+            for actions, field, message in self._RULES:
+                if action in actions and not getattr(self, field):
+                    raise ValueError(message.format(action=action))
+        return self
+
+    @classmethod
+    def cached(cls, **data):
+        """Validate ``data``, reusing the instance from an identical earlier call.
+
+        Only for read-only (query) params; instances are frozen so sharing is safe.
+        """
+        key = tuple(sorted(
+            (k, tuple(v) if isinstance(v, list) else v) for k, v in data.items()
+        ))
+        try:
+            return _validate_cached(cls, key)
+        except TypeError:  # Unhashable value; validate without caching
+            return cls(**data)
+
 
 class PaginatedParams(BaseParams):
     """Base class for paginated queries."""
@@ -39,3 +90,8 @@ class PaginatedParams(BaseParams):
         le=1000,
         description="Maximum number of results to return"
     )
+
+
+@functools.lru_cache(maxsize=512)
+def _validate_cached(cls, items: tuple):
+    return cls(**dict(items))
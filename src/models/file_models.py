@@ -1,9 +1,11 @@
 """File query and modify models."""
 
+import functools
+import re
 from typing import Optional, List
 from enum import Enum
 from pydantic import Field, field_validator, model_validator
-from .common import BaseParams, PaginatedParams, ResolveMode
+from .common import BaseParams, PaginatedParams, ResolveMode, BOOL_EXAMPLES
 
 
 class FileAction(str, Enum):
@@ -26,41 +28,72 @@ class FileModifyAction(str, Enum):
     SYNC = "sync"
 
 
+def _require_file_paths(p) -> None:
+    if not p.file_paths:
+        raise ValueError(f'file_paths is required for action: {p.action}')
+
+
+def _check_move(p) -> None:
+    # Move action requires both source and target paths
+    if not p.source_paths or not p.target_paths:
+        raise ValueError('move action requires both source_paths and target_paths')
+    if len(p.source_paths) != len(p.target_paths):
+        raise ValueError('source_paths and target_paths must have the same length')
+
+
+def _no_check(p) -> None:
+    pass
+
+
+# Per-action validation for ModifyFilesParams; actions not listed require file_paths.
+# Keyed by enum value since BaseParams stores values (use_enum_values)
+_MODIFY_FILE_RULES = {
+    FileModifyAction.MOVE.value: _check_move,
+    FileModifyAction.RESOLVE.value: _no_check,
+}
+
+
+# Depot/client paths start with '/' ('//' included); local paths are absolute or carry a drive/host ':'
+_FILE_PATH_RE = re.compile(r'/|[^:]*:')
+
+
+@functools.lru_cache(maxsize=4096)
+def _is_valid_file_path(v: str) -> bool:
+    """Whether ``v`` looks like a depot or absolute local path (memoized)."""
+    return _FILE_PATH_RE.match(v) is not None
+
+
 class QueryFilesParams(PaginatedParams):
     """File query parameters with action-specific validation."""
     action: FileAction = Field(
         description="File query action, metadata includes extra information like optional attributes and file size",
-        examples=["content", "history", "info", "metadata", "diff", "annotations"]
+        examples=("content", "history", "info", "metadata", "diff", "annotations")
     )
     file_path: str = Field(
         min_length=1,
         description="Primary file path - required for all actions",
-        examples=["//depot/projectX/file.txt", "/local/path/file.txt"]
+        examples=("//depot/projectX/file.txt", "/local/path/file.txt")
     )
     file2: Optional[str] = Field(
         default=None,
-        min_length=1,
         description="Second file path - required for diff action",
-        examples=["//depot/projectX/file2.txt"]
+        examples=("//depot/projectX/file2.txt",)
     )
     diff2: bool = Field(
         default=True,
         description="Use p4 diff2 for depot-to-depot diff, false for mixed diff",
-        examples=[True, False]
+        examples=(True, False)
     )
 
-    @model_validator(mode='after')
-    def validate_diff_params(self):
-        """Validate diff-specific parameters."""
-        if self.action == FileAction.DIFF and not self.file2:
-            raise ValueError('file2 is required for diff action')
-        return self
+    _RULES = (
+        (frozenset({FileAction.DIFF.value}), 'file2', 'file2 is required for diff action'),
+    )
 
     @field_validator('file_path', 'file2')
     @classmethod
     def validate_file_paths(cls, v: Optional[str]) -> Optional[str]:
         """Basic validation for file paths."""
-        if v and not (v.startswith('//') or v.startswith('/') or ':' in v):
+        if v and not _is_valid_file_path(v):
             raise ValueError('File path must be depot path (//depot/...) or absolute local path')
         return v
 
@@ -69,27 +102,27 @@ class ModifyFilesParams(BaseParams):
     """File modification parameters with comprehensive validation."""
     action: FileModifyAction = Field(
         description="File modification action",
-        examples=["add", "edit", "delete", "move", "revert", "reconcile", "resolve", "sync"]
+        examples=("add", "edit", "delete", "move", "revert", "reconcile", "resolve", "sync")
     )
     file_paths: Optional[List[str]] = Field(
         default=None,
         description="Should be full depot or client or local paths",
-        examples=[["//depot/projectX/file1.txt", "//workspace_name/projectX/file2.txt", "//workspace_name/...", "/path/to/local/file.txt", "/path/to/workspace/root/...", "//depot/branch/..."]]
+        examples=(["//depot/projectX/file1.txt", "//workspace_name/projectX/file2.txt", "//workspace_name/...", "/path/to/local/file.txt", "/path/to/workspace/root/...", "//depot/branch/..."],)
     )
     changelist: str = Field(
         default="default",
         description="Changelist ID or 'default' if not provided",
-        examples=["default", "12345"]
+        examples=("default", "12345")
     )
     source_paths: Optional[List[str]] = Field(
         default=None,
         description="Source paths - required for move action from source branch",
-        examples=[["//depot/projectX/file1.txt"]]
+        examples=(["//depot/projectX/file1.txt"],)
     )
     target_paths: Optional[List[str]] = Field(
         default=None,
         description="Target paths - required for move action to target branch",
-        examples=[["//depot/projectX/file1_renamed.txt"]]
+        examples=(["//depot/projectX/file1_renamed.txt"],)
     )
     mode: Optional[ResolveMode] = Field(
         default=ResolveMode.AUTO,
@@ -102,29 +135,23 @@ class ModifyFilesParams(BaseParams):
             "  - theirs: Accept changes from the depot version, overwrite yours (-at).\n"
             "  - yours: Keep your workspace version, ignore depot changes (-ay)."
         ),
-        examples=["auto", "safe", "force", "preview", "theirs", "yours"]
+        examples=("auto", "safe", "force", "preview", "theirs", "yours")
     )
     force: bool = Field(
         default=False,
         description="Force operation - use with caution",
-        examples=[False, True]
+        examples=BOOL_EXAMPLES
     )
 
+    @field_validator('changelist')
+    @classmethod
+    def default_changelist(cls, v: str) -> str:
+        """Changelist should be default if not provided."""
+        return v or "default"
+
     @model_validator(mode='after')
     def validate_file_action_params(self):
         """Validate parameters based on action type."""
-        # Changelist should be default if not provided
-        if not self.changelist:
-            self.changelist = "default"
-        # Most actions require file_paths except sync
-        if self.action not in [FileModifyAction.SYNC, FileModifyAction.MOVE, FileModifyAction.RECONCILE, FileModifyAction.RESOLVE] and not self.file_paths:
-            raise ValueError(f'file_paths is required for action: {self.action}')
-
-        # Move action requires both source and target paths
-        if self.action == FileModifyAction.MOVE:
-            if not self.source_paths or not self.target_paths:
-                raise ValueError('move action requires both source_paths and target_paths')
-            if len(self.source_paths) != len(self.target_paths):
-                raise ValueError('source_paths and target_paths must have the same length')
-
+        # Most actions require file_paths except sync/move/resolve
+        _MODIFY_FILE_RULES.get(self.action, _require_file_paths)(self)
         return self
@@ -3,7 +3,9 @@
 from typing import Optional
 from enum import Enum
 from pydantic import Field, model_validator
-from .common import BaseParams, PaginatedParams
+from .common import BaseParams, PaginatedParams, ChangelistIdOpt, CHANGELIST_ID_EXAMPLES
+
+_JOB_ID_EXAMPLES = ("job67890",)
 
 
 class JobAction(str, Enum):
@@ -20,53 +22,43 @@ class QueryJobsParams(PaginatedParams):
     """Job query parameters."""
     action: JobAction = Field(
         description="Job query action",
-        examples=["list_jobs", "get_job"]
+        examples=("list_jobs", "get_job")
     )
-    changelist_id: Optional[str] = Field(
-        default=None,
+    changelist_id: ChangelistIdOpt = Field(
         description="Changelist ID - required for list_jobs action",
-        examples=["job2345"]
+        examples=("job2345",)
     )
     job_id: Optional[str] = Field(
         default=None,
         description="Job ID - required for get_job action",
-        examples=["job67890"]
+        examples=_JOB_ID_EXAMPLES
     )
 
-    @model_validator(mode='after')
-    def validate_changelist_id_required(self):
-        """Validate changelist_id is provided when required."""
-        if self.action == JobAction.LIST_JOBS and not self.changelist_id:
-            raise ValueError('changelist_id is required for list_jobs action')
-        return self
-
-    @model_validator(mode='after')
-    def validate_job_id_required(self):
-        """Validate job_id is provided when required."""
-        if self.action == JobAction.GET_JOB and not self.job_id:
-            raise ValueError('job_id is required for get_job action')
-        return self
+    _RULES = (
+        (frozenset({JobAction.LIST_JOBS.value}), 'changelist_id', 'changelist_id is required for list_jobs action'),
+        (frozenset({JobAction.GET_JOB.value}), 'job_id', 'job_id is required for get_job action'),
+    )
 
 
 class ModifyJobsParams(BaseParams):
     action: JobModifyAction = Field(
         description="Job modification action",
-        examples=["link_job", "unlink_job"]
+        examples=("link_job", "unlink_job")
     )
     changelist_id: str = Field(
         default=None,
         description="Changelist ID - required for link_job/unlink_job actions",
-        examples=["12345"]
+        examples=CHANGELIST_ID_EXAMPLES
     )
     job_id: str = Field(
         default=None,
         description="Job ID - required for link_job/unlink_job actions",
-        examples=["job67890"]
+        examples=_JOB_ID_EXAMPLES
     )
 
     @model_validator(mode='after')
     def validate_changelist_id_and_job_id(self):
         """Validate changelist_id and job_id are provided when required."""
-        if not self.changelist_id and not self.job_id and self.action in ["link_job", "unlink_job"]:
+        if (not self.changelist_id or not self.job_id) and self.action in ["link_job", "unlink_job"]:
             raise ValueError(f"changelist_id and job_id are required for this {self.action} action")
         return self
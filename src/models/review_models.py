@@ -37,83 +37,83 @@ class QueryReviewsParams(PaginatedParams):
             "'dashboard' for current user (my reviews, needs my attention, authenticated user reviews), "
             "get specific review, transitions, files_readby, files (from/to), comments"
         ),
-        examples=["list", "dashboard", "get", "transitions", "files_readby", "files", "comments", "activity"],
+        examples=("list", "dashboard", "get", "transitions", "files_readby", "files", "comments", "activity"),
     )
     review_id: Optional[int] = Field(
         default=None,
         description="Review ID—required for get, transitions, files_readby, files, comments, and activity actions",
-        examples=[12345, 67890],
+        examples=(12345, 67890),
     )
     fields: Optional[List[str]] = Field(
         default=None,
         description="List of fields to return for list/get actions",
-        examples=[["id", "description", "author", "state"], ["id", "author", "state", "participants", "commits"]],
+        examples=(["id", "description", "author", "state"], ["id", "author", "state", "participants", "commits"]),
     )
     comments_fields: Optional[str] = Field(
         default="id,body,user,time",
         description="Comma-separated list of fields to return for comments action",
-        examples=["id,body,user,time", "id,user,time"],
+        examples=("id,body,user,time", "id,user,time"),
     )
     up_voters: Optional[List[str]] = Field(
         default=None,
         description="List of up voters for transitions action",
-        examples=[["alice", "bob"]],
+        examples=(["alice", "bob"],),
     )
     from_version: Optional[int] = Field(
         default=None,
         description="Starting version for files action",
-        examples=[1, 2],
+        examples=(1, 2),
     )
     to_version: Optional[int] = Field(
         default=None,
         description="Ending version for files action",
-        examples=[2, 3],
+        examples=(2, 3),
     )
     max_results: Optional[int] = Field(
         default=10,
         description="Maximum number of results to return",
-        examples=[10, 20, 50],
+        examples=(10, 20, 50),
     )
     # v11 list filters
     after: Optional[str] = Field(
         default=None,
         description="Review ID to seek to for pagination (list action). Reviews up to and including this ID are excluded.",
-        examples=["12344"],
+        examples=("12344",),
     )
     after_updated: Optional[str] = Field(
         default=None,
         description="Return reviews updated on the day before this date/time in seconds since epoch (list action). Mutually exclusive with 'after'.",
-        examples=["1606233362"],
+        examples=("1606233362",),
     )
     result_order: Optional[str] = Field(
         default=None,
         description="Set to 'updated' to return most recently updated reviews first (list action)",
-        examples=["updated"],
+        examples=("updated",),
     )
     projects: Optional[List[str]] = Field(
         default=None,
         description="Filter by project name(s) (list action)",
-        examples=[["myproject"], ["myproject", "gemini"]],
+        examples=(["myproject"], ["myproject", "gemini"]),
     )
     state: Optional[List[str]] = Field(
         default=None,
         description="Filter by review state(s) (list action). Valid: needsRevision, needsReview, approved, approved:isPending, approved:commit, approved:notPending, rejected, archived",
-        examples=[["needsReview"], ["needsReview", "needsRevision", "approved:isPending"]],
+        examples=(["needsReview"], ["needsReview", "needsRevision", "approved:isPending"]),
     )
     keywords: Optional[str] = Field(
         default=None,
         description="Search keyword(s) to filter reviews (list action). Use with keywords_fields.",
-        examples=["bugfix", "12345"],
+        examples=("bugfix", "12345"),
     )
     keywords_fields: Optional[List[str]] = Field(
         default=None,
         description="Fields to search keywords in (list action). Valid: changes, author, participants, hasReviewer, description, updated, projects, state, testStatus, pending, groups, id",
-        examples=[["description"], ["author"], ["changes"]],
+        examples=(["description"], ["author"], ["changes"]),
     )
     include_transitions: Optional[bool] = Field(
         default=None,
         description="Include allowed state transitions in get action response",
-        examples=[True],
+        examples=(True,),
     )
 
     @model_validator(mode="after")
@@ -124,6 +124,7 @@ class QueryReviewsParams(PaginatedParams):
             ReviewAction.TRANSITIONS,
             ReviewAction.FILES_READBY,
             ReviewAction.FILES,
+            ReviewAction.ACTIVITY,
             ReviewAction.COMMENTS,
         }
 
@@ -174,7 +175,7 @@ class CommentContext(BaseParams):
         default=None,
         description="file mandatory unless attribute or comment are set: File to comment on. " \
         "Valid only for changes and reviews topics",
-        examples=["//depot/path/to/file.txt"]
+        examples=("//depot/path/to/file.txt",)
     )
     leftLine: Optional[int] = Field(
         default="null",
@@ -195,7 +196,7 @@ class CommentContext(BaseParams):
         description="content optional, but if specified, you must also specify the leftline and rightline " \
         "parameters. Array of strings: Provide the content of the codeline the comment is on and the four " \
         "preceding codelines. Always add a newline character ('\n') to the end of each line in the array. ",
-        examples=[["line1\n", "line2\n", "line3\n", "line4\n", "line5\n"]]
+        examples=(["line1\n", "line2\n", "line3\n", "line4\n", "line5\n"],)
     )
     version: Optional[int] = Field(
         default=None,
@@ -236,148 +237,148 @@ class ModifyReviewsParams(BaseParams):
     """Review modification parameters."""
     action: ReviewModifyAction = Field(
         description="Review modification action",
-        examples=["create", "vote", "transition", "append_participants"]
+        examples=("create", "vote", "transition", "append_participants")
     )
 
     # Common identifiers
     review_id: Optional[int] = Field(
         default=None,
         description="Review ID (required for most actions except create, archive_inactive)",
-        examples=[12345]
+        examples=(12345,)
     )
     change_id: Optional[int] = Field(
         default=None,
         description="Changelist ID (required for create, append_change, replace_with_change)",
-        examples=[67890]
+        examples=(67890,)
     )
 
     # Create
     description: Optional[str] = Field(
         default=None,
         description="Review description (optional on create)",
-        examples=["Implement feature X"]
+        examples=("Implement feature X",)
     )
     reviewers: Optional[List[str]] = Field(
         default=None,
         description="List of reviewers (create_participants)",
-        examples=[["alice", "bob"]]
+        examples=(["alice", "bob"],)
     )
     required_reviewers: Optional[List[str]] = Field(
         default=None,
         description="List of required reviewers (create_participants)",
-        examples=[["carol"]]
+        examples=(["carol"],)
     )
     reviewer_groups: Optional[List[Dict[str, Any]]] = Field(
         default=None,
         description="Reviewer groups (create_participants)",
-        examples=[[{"name": "Developers", "required": "true"}]]
+        examples=([{"name": "Developers", "required": "true"}],)
     )
 
     context: Optional[CommentContext] = Field(
         default=None,
         description="Cp",
-        examples=[{"file": "//depot/path/file.txt", 
+        examples=({"file": "//depot/path/file.txt", 
                    "rightLine": 42,
                    "leftLine": 40,
                    "content": ["def example_function():\n", "    pass\n"],
                    "version": 1,
                    "attribute": "description",
-                   "comment": 22}]
+                   "comment": 22},)
     )
 
     # Vote
     vote_value: Optional[VoteValue] = Field(
         default=None,
         description="Vote value (vote action)",
-        examples=["up", "down", "clear"]
+        examples=("up", "down", "clear")
     )
     version: Optional[int] = Field(
         default=None,
         ge=1,
         description="Review version (optional for vote)",
-        examples=[2]
+        examples=(2,)
     )
 
     # Transition
     transition: Optional[ReviewTransition] = Field(
         default=None,
         description="Transition target state",
-        examples=["approved"]
+        examples=("approved",)
     )
     jobs: Optional[List[str]] = Field(
         default=None,
         description="Associated job IDs for transition",
-        examples=[["job000123", "job000456"]]
+        examples=(["job000123", "job000456"],)
     )
     fix_status: Optional[FixStatus] = Field(
         default=None,
         description="Job fix status when transitioning",
-        examples=["closed"]
+        examples=("closed",)
     )
     cleanup: Optional[bool] = Field(
         default=None,
         description="Perform cleanup for approved:commit/committed transitions",
-        examples=[True]
+        examples=(True,)
     )
 
     # Participants (structured form)
     users: Optional[Dict[str, Dict[str, str]]] = Field(
         default=None,
         description="Usernames for append/replace/delete participants (username -> {'required': 'yes'|'no'})",
-        examples=[{"alice": {"required": "yes"}, "bob": {"required": "no"}}]
+        examples=({"alice": {"required": "yes"}, "bob": {"required": "no"}},)
     )
     groups: Optional[Dict[str, Dict[str, str]]] = Field(
         default=None,
         description="Group names for append/replace/delete participants (group -> {'required': 'none'|'one'|'all'})",
-        examples=[{"dev-team": {"required": "all"}}]
+        examples=({"dev-team": {"required": "all"}},)
     )
 
     # Comments
     body: Optional[str] = Field(
         default=None,
         description="Comment body (required for add_comment, reply_comment)",
-        examples=["Looks good."]
+        examples=("Looks good.",)
     )
     task_state: Optional[TaskState] = Field(
         default=None,
         description="Task state (optional for add_comment)",
-        examples=["open"]
+        examples=("open",)
     )
     notify: Optional[NotifyMode] = Field(
         default=None,
         description="Notification mode (optional for add_comment)",
-        examples=["delayed"]
+        examples=("delayed",)
     )
 
     comment_id: Optional[int] = Field(
         default=None,
         description="Parent comment ID (reply_comment)",
-        examples=[987]
+        examples=(987,)
     )
 
     # Archive inactive
     not_updated_since: Optional[str] = Field(
         default=None,
         description="ISO date (YYYY-MM-DD) threshold for archive_inactive",
-        examples=["2024-01-15"]
+        examples=("2024-01-15",)
     )
     max_reviews: Optional[int] = Field(
         default=0,
         ge=0,
         description="Maximum number of inactive reviews to archive (0 = no limit)",
-        examples=[50]
+        examples=(50,)
     )
 
     # Update author/description
     new_author: Optional[str] = Field(
         default=None,
         description="New author username (update_author)",
-        examples=["dave"]
+        examples=("dave",)
     )
     new_description: Optional[str] = Field(
         default=None,
         description="New review description (update_description)",
-        examples=["Refined implementation details."]
+        examples=("Refined implementation details.",)
     )
 
     @model_validator(mode="after")
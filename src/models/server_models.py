@@ -15,5 +15,5 @@ class QueryServerParams(BaseParams):
     """Server information query parameters."""
     action: ServerAction = Field(
         description="Get server info or current user information",
-        examples=["server_info", "current_user"]
+        examples=("server_info", "current_user")
     )
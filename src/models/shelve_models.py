@@ -1,9 +1,8 @@
 """Shelve query and modify models."""
 
-from typing import Optional, List
 from enum import Enum
-from pydantic import Field, model_validator
-from .common import BaseParams, PaginatedParams
+from pydantic import Field
+from .common import BaseParams, PaginatedParams, ChangelistIdOpt, FilePathsOpt, UserFilterOpt, CHANGELIST_ID_EXAMPLES, BOOL_EXAMPLES
 
 
 class ShelveAction(str, Enum):
@@ -20,67 +19,57 @@ class ShelveModifyAction(str, Enum):
     UNSHELVE_TO_CHANGELIST = "unshelve_to_changelist"
 
 
+# Action sets for validators; BaseParams stores enum values (use_enum_values),
+# so these hold the plain string values
+_CHANGELIST_REQUIRED_ACTIONS = frozenset({ShelveAction.DIFF.value, ShelveAction.FILES.value})
+_FILE_PATHS_REQUIRED_ACTIONS = frozenset({
+    ShelveModifyAction.SHELVE.value,
+    ShelveModifyAction.UNSHELVE.value,
+    ShelveModifyAction.UPDATE.value,
+})
+
+
 class QueryShelvesParams(PaginatedParams):
     """Shelve query parameters."""
     action: ShelveAction = Field(
         description="Shelve query action",
-        examples=["list", "diff", "files"]
-    )
-    changelist_id: Optional[str] = Field(
-        default=None,
-        description="Changelist ID - required for diff and files actions",
-        examples=["12345"]
+        examples=("list", "diff", "files")
     )
-    user: Optional[str] = Field(
-        default=None,
-        description="Filter by user - for list action",
-        examples=["alice"]
+    changelist_id: ChangelistIdOpt = Field(
+        description="Changelist ID - required for diff and files actions"
     )
+    user: UserFilterOpt
 
-    @model_validator(mode='after')
-    def validate_changelist_id_for_actions(self):
-        """Validate changelist_id for specific actions."""
-        if self.action in [ShelveAction.DIFF, ShelveAction.FILES] and not self.changelist_id:
-            raise ValueError(f'changelist_id is required for action: {self.action}')
-        return self
+    _RULES = (
+        (_CHANGELIST_REQUIRED_ACTIONS, 'changelist_id', 'changelist_id is required for action: {action}'),
+    )
 
 
 class ModifyShelvesParams(BaseParams):
     """Shelve modification parameters."""
     action: ShelveModifyAction = Field(
         description="Shelve modification action",
-        examples=["shelve", "unshelve", "update", "delete", "unshelve_to_changelist"]
+        examples=("shelve", "unshelve", "update", "delete", "unshelve_to_changelist")
     )
     changelist_id: str = Field(
         description="Changelist ID",
-        examples=["12345"]
+        examples=CHANGELIST_ID_EXAMPLES
     )
-    file_paths: Optional[List[str]] = Field(
-        default=None,
-        description="File paths required for shelve/unshelve/update/delete - unused for others",
-        examples=[["//depot/projectX/file1.txt"]]
+    file_paths: FilePathsOpt = Field(
+        description="File paths required for shelve/unshelve/update/delete - unused for others"
     )
     target_changelist: str = Field(
         default="default",
         description="Target changelist for unshelve operations",
-        examples=["default", "54321"]
+        examples=("default", "54321")
     )
     force: bool = Field(
         default=False,
         description="Force operation - use with caution",
-        examples=[False, True]
+        examples=BOOL_EXAMPLES
     )
 
-    @model_validator(mode='after')
-    def validate_shelve_params(self):
-        """Validate parameters based on action type."""
-        if not self.changelist_id:
-            raise ValueError('changelist_id is required for all shelve actions')
-        actions_requiring_file_paths = [
-            ShelveModifyAction.SHELVE,
-            ShelveModifyAction.UNSHELVE,
-            ShelveModifyAction.UPDATE,
-        ]
-        if self.action in actions_requiring_file_paths and not self.file_paths:
-            raise ValueError(f'file_paths is required for action: {self.action}')
-        return self
+    _RULES = (
+        (frozenset(a.value for a in ShelveModifyAction), 'changelist_id', 'changelist_id is required for all shelve actions'),
+        (_FILE_PATHS_REQUIRED_ACTIONS, 'file_paths', 'file_paths is required for action: {action}'),
+    )
@@ -1,9 +1,12 @@
 from typing import Any, List, Optional
-from .common import BaseParams, PaginatedParams
+from .common import BaseParams, PaginatedParams, CHANGELIST_ID_EXAMPLES, WORKSPACE_NAME_EXAMPLES
 from pydantic import Field, model_validator, field_validator
 from enum import Enum
 import re
 
+_STREAM_EXAMPLES = ("//depot/main", "//depot/dev")
+_STREAM_PATH_EXAMPLES = ("//depot/main",)
+
 
 # =============================================================================
 # ENUMS
@@ -73,9 +76,9 @@ class QueryStreamsParams(PaginatedParams):
             "'validate_file' paths against stream view, 'validate_submit' opened files, "
             "'check_resolve' for pending spec conflicts, 'interchanges' between streams"
         ),
-        examples=["list", "get", "children", "parent", "graph", "integration_status",
+        examples=("list", "get", "children", "parent", "graph", "integration_status",
                    "get_workspace", "list_workspaces", "validate_file", "validate_submit",
-                   "check_resolve", "interchanges"],
+                   "check_resolve", "interchanges"),
     )
 
     # --- Common identifiers ---
@@ -86,14 +89,14 @@ class QueryStreamsParams(PaginatedParams):
             "Required for: get, children, parent, graph, integration_status, "
             "list_workspaces, check_resolve, interchanges"
         ),
-        examples=["//depot/main", "//depot/dev"],
+        examples=_STREAM_EXAMPLES,
     )
 
     # --- list_streams filters ---
     stream_path: Optional[List[str]] = Field(
         default=None,
         description="Stream path pattern(s) for 'list' action (e.g. ['//depot/...'])",
-        examples=[["//depot/..."]],
+        examples=(["//depot/..."],),
     )
     filter: Optional[str] = Field(
         default=None,
@@ -102,12 +105,12 @@ class QueryStreamsParams(PaginatedParams):
             "Supports &, |, and parentheses. "
             "E.g. \"Parent=//Ace/MAIN&(Type=development|Type=release)\""
         ),
-        examples=["Owner=alice&Type=development"],
+        examples=("Owner=alice&Type=development",),
     )
     fields: Optional[List[str]] = Field(
         default=None,
         description="Fields to return for 'list' (e.g. ['Stream', 'Owner', 'Name', 'Type'])",
-        examples=[["Stream", "Owner", "Name", "Type"]],
+        examples=(["Stream", "Owner", "Name", "Type"],),
     )
     unloaded: bool = Field(
         default=False,
@@ -123,7 +126,7 @@ class QueryStreamsParams(PaginatedParams):
             "Single depot file path to filter streams whose views contain this path. "
             "E.g. 'foo.c' or '//depot/path/...'. Supports optional revRange."
         ),
-        examples=["//depot/project/..."],
+        examples=("//depot/project/...",),
     )
 
     # --- get_stream options ---
@@ -134,7 +137,7 @@ class QueryStreamsParams(PaginatedParams):
     at_change: Optional[str] = Field(
         default=None,
         description="Changelist number to retrieve historical stream spec (e.g. '12345')",
-        examples=["12345"],
+        examples=CHANGELIST_ID_EXAMPLES,
     )
 
     # --- integration_status options ---
@@ -153,29 +156,29 @@ class QueryStreamsParams(PaginatedParams):
         description=(
             "Workspace name for get_workspace, validate_file, validate_submit actions"
         ),
-        examples=["my_workspace"],
+        examples=WORKSPACE_NAME_EXAMPLES,
     )
     template: Optional[str] = Field(
         default=None,
         description="Template workspace for get_workspace",
-        examples=["template_ws"],
+        examples=("template_ws",),
     )
     user: Optional[str] = Field(
         default=None,
         description="Filter workspaces by user (list_workspaces)",
-        examples=["alice"],
+        examples=("alice",),
     )
 
     # --- validate ---
     file_paths: Optional[List[str]] = Field(
         default=None,
         description="File paths to validate against stream view (validate_file)",
-        examples=[["//depot/main/file.txt"]],
+        examples=(["//depot/main/file.txt"],),
     )
     changelist: Optional[str] = Field(
         default=None,
         description="Changelist to validate (validate_submit) or shelve/unshelve spec",
-        examples=["12345"],
+        examples=CHANGELIST_ID_EXAMPLES,
     )
 
     # --- interchanges ---
@@ -191,7 +194,7 @@ class QueryStreamsParams(PaginatedParams):
         default=None,
         ge=1,
         description="Maximum changelists for interchanges",
-        examples=[10, 50],
+        examples=(10, 50),
     )
 
     # --- validators ---
@@ -238,8 +241,8 @@ class ModifyStreamsParams(BaseParams):
             "'copy', 'merge', 'integrate', 'populate' for propagation, "
             "'switch' workspace stream, 'create_workspace' for a stream"
         ),
-        examples=["create", "update", "delete", "merge", "integrate", "copy",
-                   "populate", "switch", "create_workspace"],
+        examples=("create", "update", "delete", "merge", "integrate", "copy",
+                   "populate", "switch", "create_workspace"),
     )
 
     # --- Common identifiers ---
@@ -251,29 +254,29 @@ class ModifyStreamsParams(BaseParams):
             "revert_spec, switch, create_workspace. "
             "Also used as -S flag for copy/merge/integrate/populate."
         ),
-        examples=["//depot/main", "//depot/dev"],
+        examples=_STREAM_EXAMPLES,
     )
 
     # --- create_stream / update_stream ---
     stream_type: Optional[str] = Field(
         default=None,
         description="Stream type (required for create): mainline, development, sparsedev, release, sparserel, task, virtual",
-        examples=["mainline", "development", "release"],
+        examples=("mainline", "development", "release"),
     )
     parent: Optional[str] = Field(
         default=None,
         description="Parent stream (required for non-mainline create)",
-        examples=["//depot/main"],
+        examples=_STREAM_PATH_EXAMPLES,
     )
     name: Optional[str] = Field(
         default=None,
         description="Short display name for the stream",
-        examples=["dev-feature-x"],
+        examples=("dev-feature-x",),
     )
     description: Optional[str] = Field(
         default=None,
         description="Stream or workspace description",
-        examples=["Development stream for feature X"],
+        examples=("Development stream for feature X",),
     )
     options: Optional[str] = Field(
         default=None,
@@ -281,34 +284,34 @@ class ModifyStreamsParams(BaseParams):
             "Stream options string: 'allsubmit/ownersubmit unlocked/locked "
             "toparent/notoparent fromparent/nofromparent mergedown/mergeany'"
         ),
-        examples=["allsubmit unlocked toparent fromparent mergedown"],
+        examples=("allsubmit unlocked toparent fromparent mergedown",),
     )
     parent_view: Optional[str] = Field(
         default=None,
         description="Parent view treatment: 'inherit' or 'noinherit'",
-        examples=["inherit", "noinherit"],
+        examples=("inherit", "noinherit"),
     )
     paths: Optional[List[str]] = Field(
         default=None,
         description="Stream view paths (e.g. ['share ...', 'isolate dir/...'])",
-        examples=[["share ...", "isolate dir/..."]],
+        examples=(["share ...", "isolate dir/..."],),
     )
     remapped: Optional[List[str]] = Field(
         default=None,
         description="Remapped paths (e.g. ['dir/... other_dir/...'])",
-        examples=[["dir/... other_dir/..."]],
+        examples=(["dir/... other_dir/..."],),
     )
     ignored: Optional[List[str]] = Field(
         default=None,
         description="Ignored paths (e.g. ['*.tmp', 'temp/...'])",
-        examples=[["*.tmp", "temp/..."]],
+        examples=(["*.tmp", "temp/..."],),
     )
 
     # --- spec editing ---
     changelist: Optional[str] = Field(
         default=None,
         description="Changelist for edit_spec, shelve_spec, unshelve_spec, or propagation ops",
-        examples=["12345", "default"],
+        examples=("12345", "default"),
     )
     resolve_mode: Optional[str] = Field(
         default=None,
@@ -316,29 +319,29 @@ class ModifyStreamsParams(BaseParams):
             "Resolve mode for resolve_spec action: "
             "'auto' (default), 'accept_theirs', 'accept_yours'"
         ),
-        examples=["auto", "accept_theirs", "accept_yours"],
+        examples=("auto", "accept_theirs", "accept_yours"),
     )
     target_changelist: Optional[str] = Field(
         default=None,
         description="Target changelist for unshelve_spec",
-        examples=["default", "12345"],
+        examples=("default", "12345"),
     )
 
     # --- propagation common (copy / merge / integrate / populate) ---
     parent_stream: Optional[str] = Field(
         default=None,
         description="Override parent stream for copy/merge/integrate/populate (-P flag)",
-        examples=["//depot/main"],
+        examples=_STREAM_PATH_EXAMPLES,
     )
     branch: Optional[str] = Field(
         default=None,
         description="Branch spec name for integrate/populate (-b flag)",
-        examples=["my-branch-spec"],
+        examples=("my-branch-spec",),
     )
     file_paths: Optional[List[str]] = Field(
         default=None,
         description="File paths for propagation or validation",
-        examples=[["//depot/main/src/..."]],
+        examples=(["//depot/main/src/..."],),
     )
     preview: bool = Field(
         default=False,
@@ -360,7 +363,7 @@ class ModifyStreamsParams(BaseParams):
         default=None,
         ge=1,
         description="Limit number of files processed (-m flag)",
-        examples=[100],
+        examples=(100,),
     )
     output_base: bool = Field(
         default=False,
@@ -394,41 +397,41 @@ class ModifyStreamsParams(BaseParams):
     source_path: Optional[str] = Field(
         default=None,
         description="Source path for populate",
-        examples=["//depot/main/src/..."],
+        examples=("//depot/main/src/...",),
     )
     target_path: Optional[str] = Field(
         default=None,
         description="Target path for populate",
-        examples=["//depot/dev/src/..."],
+        examples=("//depot/dev/src/...",),
     )
 
     # --- switch_stream ---
     workspace: Optional[str] = Field(
         default=None,
         description="Workspace name for switch or create_workspace",
-        examples=["my_workspace"],
+        examples=WORKSPACE_NAME_EXAMPLES,
     )
 
     # --- create_stream_workspace extras ---
     workspace_name: Optional[str] = Field(
         default=None,
         description="Workspace name to create (create_workspace action)",
-        examples=["my-stream-ws"],
+        examples=("my-stream-ws",),
     )
     root: Optional[str] = Field(
         default=None,
         description="Workspace root directory (create_workspace)",
-        examples=["/home/user/workspace"],
+        examples=("/home/user/workspace",),
     )
     host: Optional[str] = Field(
         default=None,
         description="Host restriction for workspace (create_workspace)",
-        examples=["build-server-01"],
+        examples=("build-server-01",),
     )
     alt_roots: Optional[List[str]] = Field(
         default=None,
         description="Alternate root paths for workspace (create_workspace)",
-        examples=[["/tmp/alt1", "/tmp/alt2"]],
+        examples=(["/tmp/alt1", "/tmp/alt2"],),
     )
 
     # --- validators ---
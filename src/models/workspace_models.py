@@ -2,10 +2,13 @@
 
 from typing import Optional, List
 from enum import Enum
-from pydantic import Field, field_validator, model_validator, ConfigDict
-from .common import BaseParams, PaginatedParams
+from pydantic import Field, field_validator, ConfigDict
+from .common import BaseParams, PaginatedParams, WORKSPACE_NAME_EXAMPLES
 import re
 
+_WS_NAME_RE = re.compile(r'^[a-zA-Z0-9._-]+$')
+_VIEW_RE = re.compile(r'^//[\w/.-]+/\.\.\.\s+//[\w/.-]+/\.\.\.$')
+
 
 class WorkspaceAction(str, Enum):
     GET = "get"
@@ -30,40 +33,40 @@ class WorkspaceSpec(BaseParams):
         min_length=1,
         max_length=255,
         description="Name of the workspace if not provided, consider the current workspace - mandatory field",
-        examples=["my_workspace", "dev_branch_workspace"]
+        examples=("my_workspace", "dev_branch_workspace")
     )
     Root: Optional[str] = Field(
         default=None,
         description="Root path of the workspace",
-        examples=["/depot/workspace", "C:\\workspace"]
+        examples=("/depot/workspace", "C:\\workspace")
     )
     Description: Optional[str] = Field(
         default=None,
         max_length=1000,
         description="Workspace description",
-        examples=["Workspace for project X", "Development workspace"]
+        examples=("Workspace for project X", "Development workspace")
     )
     Options: Optional[str] = Field(
         default="noallwrite noclobber nocompress unlocked nomodtime normdir",
         description="Workspace options",
-        examples=["noallwrite clobber nocompress unlocked nomodtime normdir"]
+        examples=("noallwrite clobber nocompress unlocked nomodtime normdir",)
     )
     LineEnd: Optional[str] = Field(
         default="local",
         description="Line ending style",
-        examples=["local", "unix", "win", "mac"]
+        examples=("local", "unix", "win", "mac")
     )
     View: Optional[List[str]] = Field(
         default=None,
         description="View mappings - each mapping should follow depot-to-client format",
-        examples=[["//depot/projectX/... //my_workspace/projectX/..."]]
+        examples=(["//depot/projectX/... //my_workspace/projectX/..."],)
     )
 
     @field_validator('Name')
     @classmethod
     def validate_workspace_name(cls, v: str) -> str:
         """Validate workspace name follows Perforce naming conventions."""
-        if not re.match(r'^[a-zA-Z0-9._-]+$', v):
+        if not _WS_NAME_RE.match(v):
             raise ValueError('Workspace name can only contain alphanumeric characters, dots, underscores, and hyphens')
         return v
 
@@ -73,62 +76,57 @@ class WorkspaceSpec(BaseParams):
         """Validate view mappings format."""
         if v:
             for mapping in v:
-                if not re.match(r'^//[\w/.-]+/\.\.\.\s+//[\w/.-]+/\.\.\.$', mapping.replace('\\', '/')):
+                if not _VIEW_RE.match(mapping.replace('\\', '/')):
                     raise ValueError(f'Invalid view mapping format: {mapping}')
         return v
 
 
+# Action sets for validators; BaseParams stores enum values (use_enum_values),
+# so these hold the plain string values
+_WS_NAME_REQUIRED_ACTIONS = frozenset({WorkspaceAction.GET.value, WorkspaceAction.TYPE.value, WorkspaceAction.STATUS.value})
+_WS_SPECS_REQUIRED_ACTIONS = frozenset({WorkspaceModifyAction.CREATE.value, WorkspaceModifyAction.UPDATE.value})
+
+
 class QueryWorkspacesParams(PaginatedParams):
     """Workspace query parameters with conditional validation."""
     action: WorkspaceAction = Field(
         description="Workspace query action",
-        examples=["list", "get", "type", "status"]
+        examples=("list", "get", "type", "status")
     )
     workspace_name: Optional[str] = Field(
         default=None,
-        min_length=1,
         description="Workspace name - required for get, type, status actions",
-        examples=["my_workspace"]
+        examples=WORKSPACE_NAME_EXAMPLES
     )
     user: Optional[str] = Field(
         default=None,
         min_length=1,
         description="Filter by user - optional for list action",
-        examples=["alice", "bob"]
+        examples=("alice", "bob")
     )
 
-    @model_validator(mode='after')
-    def validate_workspace_name_required(self):
-        """Validate workspace_name is provided when required."""
-        if self.action in [WorkspaceAction.GET, WorkspaceAction.TYPE, WorkspaceAction.STATUS]:
-            if not self.workspace_name:
-                raise ValueError(f'workspace_name is required for action: {self.action}')
-        return self
+    _RULES = (
+        (_WS_NAME_REQUIRED_ACTIONS, 'workspace_name', 'workspace_name is required for action: {action}'),
+    )
 
 
 class ModifyWorkspacesParams(BaseParams):
     """Workspace modification parameters."""
     action: WorkspaceModifyAction = Field(
         description="Workspace modification action",
-        examples=["create", "update", "delete", "switch"]
+        examples=("create", "update", "delete", "switch")
     )
     name: str = Field(
         min_length=1,
         description="Workspace name",
-        examples=["my_workspace"]
+        examples=WORKSPACE_NAME_EXAMPLES
     )
     specs: Optional[WorkspaceSpec] = Field(
         default=None,
         description="Workspace specification - required for create and update actions"
     )
 
-    @model_validator(mode='after')
-    def validate_workspace_params(self):
-        """Validate parameters based on action type."""
-        if self.action in [WorkspaceModifyAction.CREATE, WorkspaceModifyAction.UPDATE]:
-            if not self.specs:
-                raise ValueError(f'specs is required for action: {self.action}')
-        elif self.action == WorkspaceModifyAction.DELETE:
-            if not self.name:
-                raise ValueError('name is required for delete action')
-        return self
+    _RULES = (
+        (_WS_SPECS_REQUIRED_ACTIONS, 'specs', 'specs is required for action: {action}'),
+        (frozenset({WorkspaceModifyAction.DELETE.value}), 'name', 'name is required for delete action'),
+    )
@@ -1,10 +1,14 @@
-import json
+import asyncio
 import logging
+import weakref
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Optional
 
 from fastmcp import FastMCP, Context
 from .core.config import Config
 from .logging.global_logging import setup_logging
-from .logging.session_logging import log_tool_call
+from .logging.session_logging import log_tool_call, _dumps
 from .core.connection import P4ConnectionManager
 
 from .handlers.handlers import Handlers
@@ -13,18 +17,35 @@ from .tools import ALL_REGISTRARS
 
 logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=None)
+def _toolset_of(tool_name: str) -> str:
+    """Return the toolset part of a tool name, e.g. 'query_files' -> 'files'"""
+    return tool_name.split('_')[1] if '_' in tool_name else "unknown"
+
+
 class P4MCPServer:
     """Perforce MCP Server with improved structure"""
 
+    LOG_QUEUE_SIZE = 1024  # Pending tool call log entries before the oldest is dropped
+
     def __init__(self, session_id: str = None, readonly: bool = True, toolsets: list = [], search_transform: str = None, ssl_verify=None):
         self.readonly = readonly
         self.toolsets = toolsets
         self.session_id = session_id
         self.search_transform = search_transform
+        # MCP client name per client session, filled by _client_name()
+        self._client_names = weakref.WeakKeyDictionary()
+        # Tool-call log entries, drained by _log_worker once the first one arrives
+        self._log_queue: Optional[asyncio.Queue] = None
+        self._log_task: Optional[asyncio.Task] = None
 
         setup_logging()
         self.p4config = Config.load()
         self.p4_manager = P4ConnectionManager(self.p4config)
+        # (resource, params JSON) -> (timestamp, result) for recent query results;
+        # shared with services so a write invalidates both layers
+        self.read_cache = self.p4_manager.read_cache
 
         # CLI args take priority over config/env for SSL verify
         if ssl_verify is not None:
@@ -37,10 +58,36 @@ class P4MCPServer:
     
         logger.info(f"Enabled toolsets: {', '.join(self.toolsets) if self.toolsets else 'None'}")
 
-        self.mcp = FastMCP("P4 MCP Server", middleware=[CheckPermissionMiddleware(self.p4_manager)])
+        self.mcp = FastMCP(
+            "P4 MCP Server",
+            middleware=[CheckPermissionMiddleware(self.p4_manager)],
+            lifespan=self._lifespan,
+        )
         self._initialize_dependencies()
         self._apply_search_transforms()
     
+    @asynccontextmanager
+    async def _lifespan(self, mcp: FastMCP):
+        """Warm up the P4 connection in the background so the first tool call skips connect and login
+
+        The warm-up does not delay the MCP handshake; tool calls that arrive
+        first wait for it on the connection lock.
+        """
+        warm_up = asyncio.create_task(self._warm_up_connection())
+        try:
+            yield
+        finally:
+            warm_up.cancel()
+            self._drain_tool_logs()
+
+    async def _warm_up_connection(self) -> None:
+        """Open the shared P4 connection once; failures are retried by the next get_connection()"""
+        try:
+            async with self.p4_manager.get_connection():
+                pass
+        except Exception as e:
+            logger.warning("Could not connect to P4 at startup: %s", e)
+
     def _initialize_dependencies(self) -> None:
         """Initialize all dependencies with proper error handling"""
         try:
@@ -51,7 +98,7 @@ class P4MCPServer:
             raise
 
     def _initialize_handlers(self) -> None:
-        """Initialize handlers with all services from the services package.
+        """Initialize handlers with the services of the enabled toolsets.
 
         Services are imported explicitly rather than via ``pkgutil.iter_modules``
         so that discovery works inside PyInstaller binaries.
@@ -79,6 +126,10 @@ class P4MCPServer:
         all_services = {}
         for module in _SERVICE_MODULES:
             module_name = module.__name__.rsplit(".", 1)[-1]
+            # e.g. "file_services" -> "files"; server tools are always registered
+            toolset = module_name[:-len("_services")]
+            if toolset != "server" and f"{toolset}s" not in self.toolsets:
+                continue
             # e.g. "file_services" -> "FileServices"
             class_name = module_name.replace("_", " ").title().replace(" ", "")
             cls = getattr(module, class_name, None)
@@ -91,21 +142,78 @@ class P4MCPServer:
 
         self.handlers = Handlers(**all_services)
 
-    def process_tool_logs(self, tool_name: str, result: dict, ctx: Context) -> dict:
-        """Process incoming data and route to appropriate handler"""
+    def process_tool_logs(self, tool_name: str, result: dict, ctx: Context) -> None:
+        """Queue a tool call log entry; it is written after the tool response is returned"""
+        if not logger.isEnabledFor(logging.INFO) and not self.session_id:
+            return
+
+        entry = (
+            self._client_name(ctx),
+            tool_name,
+            result.get('action', 'unknown'),
+            result.get('status', 'unknown'),
+        )
+        queue = self._log_queue
+        if queue is None:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                # No event loop to defer to; write it now
+                self._write_tool_log(*entry)
+                return
+            queue = self._log_queue = asyncio.Queue(maxsize=self.LOG_QUEUE_SIZE)
+            self._log_task = asyncio.create_task(self._log_worker())
+        if queue.full():
+            queue.get_nowait()  # Drop the oldest entry rather than block the caller
+        queue.put_nowait(entry)
+
+    async def _log_worker(self) -> None:
+        """Write queued tool call log entries"""
+        queue = self._log_queue
+        while True:
+            entry = await queue.get()
+            try:
+                self._write_tool_log(*entry)
+            except Exception as e:
+                logger.warning("Failed to log tool call: %s", e)
+
+    def _drain_tool_logs(self) -> None:
+        """Stop the log worker and write any entries it has not reached yet"""
+        if self._log_task is not None:
+            self._log_task.cancel()
+            self._log_task = None
+        queue, self._log_queue = self._log_queue, None
+        while queue is not None and not queue.empty():
+            self._write_tool_log(*queue.get_nowait())
+
+    def _write_tool_log(self, mcp_client: str, tool_name: str, action: str, status: str) -> None:
+        """Log a tool call to the global log and, if enabled, the session log"""
         response = {}
-        response['mcp_client'] = ctx.session.client_params.clientInfo.name if ctx and ctx.session and ctx.session.client_params else "Unknown"
-        response['toolset'] = tool_name.split('_')[1] if '_' in tool_name else "unknown"
+        response['mcp_client'] = mcp_client
+        response['toolset'] = _toolset_of(tool_name)
         response['tool_name'] = tool_name
-        response['tool_action'] = result.get('action', 'unknown')
-        response['status'] = result.get('status', 'unknown')
+        response['tool_action'] = action
+        response['status'] = status
         response['p4_version'] = getattr(self.p4config, 'p4version', 'Unknown')
 
-        logger.info('tool_call: %s', json.dumps(response))
+        if logger.isEnabledFor(logging.INFO):
+            logger.info('tool_call: %s', _dumps(response))
 
         if self.session_id:
             log_tool_call(response, session_id=self.session_id)
 
+    def _client_name(self, ctx: Context) -> str:
+        """Return the MCP client name for the context's session, resolved once per session"""
+        session = ctx.session if ctx else None
+        if session is None:
+            return "Unknown"
+        name = self._client_names.get(session)
+        if name is None:
+            if not session.client_params:
+                return "Unknown"
+            name = self._client_names[session] = session.client_params.clientInfo.name
+        return name
+
     def _register_tools(self):
         """Register all tools by delegating to per-toolset modules."""
         for registrar in ALL_REGISTRARS:
@@ -13,6 +13,7 @@ Write service for tools:
 - move_files_to_changelist : Move files between changelists
 """
 
+import asyncio
 import logging
 from typing import List, Dict, Any, Optional
 from P4 import P4Exception
@@ -21,29 +22,46 @@ from ..core.connection import P4ConnectionManager
 
 logger = logging.getLogger(__name__)
 
+# Max file arguments per batched p4 command, to stay well under argv limits
+BATCH_SIZE = 500
+
+
+async def _p4_call(fn, *args):
+    """Run a blocking P4Python call on a worker thread to keep the event loop free
+
+    The caller must hold the connection via get_connection(), which serializes
+    access to the shared P4 handle.
+    """
+    return await asyncio.to_thread(fn, *args)
+
 class ChangelistServices:
     """Changelist services for changelist operations"""
     
     def __init__(self, connection_manager: P4ConnectionManager):
         self.connection_manager = connection_manager
+        # Blank 'change -o' spec per (client, user), reused by create_changelist
+        self._change_templates: Dict[tuple, Dict[str, Any]] = {}
+        # Whether each user has a JobView, which makes blank specs carry live Jobs
+        self._job_views: Dict[str, bool] = {}
 
     async def get_changelist(self, changelist_id: str) -> Dict[str, Any]:
         """Get details of a specific changelist"""
         async with self.connection_manager.get_connection() as p4:
             try:
                 if changelist_id and changelist_id == "default":
-                    opened_files = p4.run("opened", "-c", "default")
+                    opened_files = await _p4_call(p4.run, "opened", "-c", "default")
                     return {"status": "success", "message": {"opened_files": opened_files}}
-                changelist = p4.run("describe", changelist_id)
+                changelist = await _p4_call(p4.run, "describe", changelist_id)
                 if not changelist:
                     raise ValueError(f"Changelist '{changelist_id}' not found")
-                return {"status": "success", "message": {k: v for k, v in changelist[0].items()}}
+                return {"status": "success", "message": changelist[0]}
             except P4Exception as e:
                 logger.error(f"P4Error: Failed to get changelist '{changelist_id}': {e}")
                 return {"status": "error", "message": f"Failed to get changelist '{changelist_id}': {e}"}
 
-    async def list_changelists(self, workspace_name: str, status: str, user: str, depot_path: str, limit: int=100) -> List[Dict[str, Any]]:
-        """List recent changelists"""
+    async def list_changelists(self, workspace_name: str, status: str, user: str, depot_path: str, limit: int=100,
+                               fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """List recent changelists, optionally projected onto ``fields``"""
         async with self.connection_manager.get_connection() as p4:
             try:
                 # current_user = p4.run("info")[0]["userName"]
@@ -56,8 +74,10 @@ class ChangelistServices:
                     args.extend(["-u", user])
                 if depot_path:
                     args.append(depot_path)
-                changelists = p4.run(*args)
-                return {"status": "success", "message": [{k: v for k, v in cl.items()} for cl in changelists if len(cl) > 0]}
+                changelists = await _p4_call(p4.run, *args)
+                if fields:
+                    return {"status": "success", "message": [{k: cl[k] for k in fields if k in cl} for cl in changelists if cl]}
+                return {"status": "success", "message": [cl for cl in changelists if cl]}
             except P4Exception as e:
                 logger.error(f"P4Error: Failed to list changelists: {e}")
                 return {"status": "error", "message": str(e)}
@@ -66,26 +86,41 @@ class ChangelistServices:
         """Create a new changelist"""
         async with self.connection_manager.get_connection() as p4:
             try:
-                changelist = p4.fetch_change()
-                changelist._description = description
-                if 'Files' in changelist:
-                    changelist._files = []
-                result = p4.save_change(changelist)
+                # Without a JobView the blank spec only varies by client and user, so fetch it once
+                key = (p4.client, p4.user)
+                template = self._change_templates.get(key)
+                if template is None:
+                    blank = await _p4_call(p4.fetch_change)
+                    # Files lists what the default changelist holds right now
+                    template = {k: v for k, v in blank.items() if k != "Files"}
+                    # Jobs are filled from the user's JobView and change as jobs do
+                    if not await self._has_job_view(p4):
+                        self._change_templates[key] = template
+                changelist = dict(template, Description=description)
+                result = await _p4_call(p4.save_change, changelist)
                 return {"status": "success", "message": result}
             except P4Exception as e:
                 logger.error(f"P4Error: Failed to create changelist: {e}")
                 return {"status": "error", "message": str(e)}
 
+    async def _has_job_view(self, p4) -> bool:
+        """Return whether the current user has a JobView, checking once per user"""
+        has_view = self._job_views.get(p4.user)
+        if has_view is None:
+            user_spec = await _p4_call(p4.run, "user", "-o")
+            has_view = self._job_views[p4.user] = bool(user_spec and user_spec[0].get("JobView"))
+        return has_view
+
     async def update_changelist(self, changelist_id: str, description: str) -> List[str]:
         """Update an existing changelist"""
         async with self.connection_manager.get_connection() as p4:
             try:
-                if not await self.verify_changelist(p4, changelist_id):
+                changelist = await self.verify_changelist(p4, changelist_id, await self.connection_manager.get_user(p4))
+                if not changelist:
                     raise ValueError(f"Changelist '{changelist_id}' does not exist or is not valid for update")
 
-                changelist = p4.fetch_change(changelist_id)
                 changelist._description = description
-                result = p4.save_change(changelist)
+                result = await _p4_call(p4.save_change, changelist)
                 return {"status": "success", "message": result}
             except P4Exception as e:
                 logger.error(f"P4Error: Failed to update changelist '{changelist_id}': {e}")
@@ -95,11 +130,11 @@ class ChangelistServices:
         """Submit a changelist"""
         async with self.connection_manager.get_connection() as p4:
             try:
-                if not await self.verify_changelist(p4, changelist_id):
+                if not await self.verify_changelist(p4, changelist_id, await self.connection_manager.get_user(p4)):
                     raise ValueError(f"Changelist '{changelist_id}' does not exist or is not valid for submit")
                 
-                submit_result = p4.run_submit("-c", changelist_id)
-                return {"status": "success", "message": {k: v for k, v in submit_result[0].items()}}
+                submit_result = await _p4_call(p4.run_submit, "-c", changelist_id)
+                return {"status": "success", "message": submit_result[0]}
 
             except P4Exception as e:
                 logger.error(f"P4Error: Failed to submit changelist '{changelist_id}': {e}")
@@ -109,14 +144,14 @@ class ChangelistServices:
         """Delete a changelist"""
         async with self.connection_manager.get_connection() as p4:
             try:
-                if not await self.verify_changelist(p4,changelist_id):
+                spec = await self.verify_changelist(p4, changelist_id, await self.connection_manager.get_user(p4))
+                if not spec:
                     raise ValueError(f"Changelist '{changelist_id}' does not exist or is not valid for delete")
 
-                # Check for open files to ensure the changelist is empty before deletion
-                open_files = p4.run("opened", "-c", changelist_id)
-                if open_files:
+                # The change spec already lists the changelist's open files
+                if spec.get('Files'):
                     raise ValueError(f"Cannot delete changelist '{changelist_id}': it contains open files")
-                result = p4.run("change", "-d", changelist_id)
+                result = await _p4_call(p4.run, "change", "-d", changelist_id)
                 return {"status": "success", "message": result}
             except P4Exception as e:
                 logger.error(f"P4Error: Failed to delete changelist '{changelist_id}': {e}")
@@ -127,12 +162,13 @@ class ChangelistServices:
         async with self.connection_manager.get_connection() as p4:
             result = []
             try:
-                if not await self.verify_changelist(p4, changelist_id):
-                    raise ValueError(f"Changelist '{changelist_id}' does not exist or is not valid for move files")
                 if not files or not isinstance(files, list):
                     raise ValueError("No files provided to move to changelist")
-                for file in files:
-                    result.append(p4.run("reopen", "-c", changelist_id, file))
+                if not await self.verify_changelist(p4, changelist_id, await self.connection_manager.get_user(p4)):
+                    raise ValueError(f"Changelist '{changelist_id}' does not exist or is not valid for move files")
+                # One reopen per batch of files instead of one per file
+                for i in range(0, len(files), BATCH_SIZE):
+                    result.extend(await _p4_call(p4.run, "reopen", "-c", changelist_id, *files[i:i + BATCH_SIZE]))
                 return {"status": "success", "message": result}
             except P4Exception as e:
                 logger.error(f"P4Error: Failed to move files to changelist '{changelist_id}': {e}")
@@ -140,20 +176,25 @@ class ChangelistServices:
             
     
     @staticmethod
-    async def verify_changelist(p4, changelist_id: str) -> bool:
-        """Verify if a changelist exists"""
+    async def verify_changelist(p4, changelist_id: str, user: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Verify if a changelist exists and is owned by ``user`` (looked up via `p4 info` if omitted)
+
+        Returns the change spec on success so callers can reuse it, None otherwise.
+        Uses `change -o` rather than `describe`, which would also enumerate the files.
+        """
         try:
-            changelist = p4.run("describe", changelist_id)
+            changelist = await _p4_call(p4.fetch_change, changelist_id)
             if not changelist:
                 raise ValueError(f"Changelist '{changelist_id}' not found")
-            changelist = changelist[0]
-            if changelist['user'] != p4.run("info")[0]["userName"]:
+            if user is None:
+                user = (await _p4_call(p4.run, "info"))[0]["userName"]
+            if changelist['User'] != user:
                 raise PermissionError(f"Cannot update changelist '{changelist_id}': not owned by current user")
-            if changelist['status'] == 'submitted':
+            if changelist['Status'] == 'submitted':
                 raise ValueError(f"Cannot update submitted changelist '{changelist_id}'")
-            return True
+            return changelist
         except P4Exception as e:
             logger.error(f"P4Error: Failed to verify changelist '{changelist_id}': {e}")
-            return False
+            return None
 
     
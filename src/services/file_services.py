@@ -21,6 +21,7 @@ Write service for tools:
 
 """
 
+import asyncio
 import logging
 from typing import List, Dict, Any
 from P4 import P4Exception
@@ -38,6 +39,51 @@ RESOLVE_MODE_FLAGS = {
     "yours": "-ay",
 }
 
+# Seconds fstat/filelog results are reused (writes through the tools clear them sooner)
+FILE_CACHE_TTL = 30.0
+
+# Max file arguments per batched p4 command, to stay well under argv limits
+BATCH_SIZE = 500
+
+
+def _run_batched(p4, cmd: tuple, file_paths: List[str]) -> tuple:
+    """Run ``cmd`` over file_paths, one p4 command per BATCH_SIZE paths
+
+    Returns ``(results, problems)``. Up to BATCH_SIZE paths run as one command
+    and raise on warnings as usual. Larger lists run at exception_level 1:
+    warnings (already opened, no such file, ...) do not raise, and an error in
+    one batch does not stop the later ones, so every path is attempted and the
+    output of the batches that ran is kept.
+    """
+    if len(file_paths) <= BATCH_SIZE:
+        return p4.run(*cmd, *file_paths), []
+    result, problems = [], []
+    prev_level = p4.exception_level
+    p4.exception_level = 1
+    try:
+        for i in range(0, len(file_paths), BATCH_SIZE):
+            try:
+                result.extend(p4.run(*cmd, *file_paths[i:i + BATCH_SIZE]))
+                problems.extend(p4.warnings)
+            except P4Exception as e:
+                problems.append(str(e))
+    finally:
+        p4.exception_level = prev_level
+    return result, problems
+
+
+def _batched_response(result: list, problems: list) -> Dict[str, Any]:
+    """Build the tool response for a _run_batched write"""
+    if not problems:
+        return {"status": "success", "message": result}
+    if not result:
+        return {"status": "error", "message": "\n".join(problems)}
+    # Some paths were applied: report them alongside what went wrong for the rest
+    return {"status": "success", "message": result, "warnings": problems}
+
+# fstat fields only present because of -Oa (attr-*) / -Ol (fileSize, digest)
+_METADATA_ONLY_FIELDS = frozenset({"fileSize", "digest"})
+
 class FileServices:
     """File services for file operations"""
     
@@ -51,57 +97,64 @@ class FileServices:
                 content = p4.run("print", file_path)
                 return {"status": "success", "message": content}
             except P4Exception as e:
-                logger.error(f"P4Error: Failed to get file content '{file_path}': {e}")
+                logger.error("P4Error: Failed to get file content '%s': %s", file_path, e)
                 return {"status": "error", "message": str(e)}
 
     async def get_file_history(self, file_path: str, limit: int=100) -> List[Dict[str, Any]]:
         """Get history of a file in the depot"""
         async with self.connection_manager.get_connection() as p4:
             try:
-                history = p4.run("filelog", f"-m{limit}", file_path)
-                return {"status": "success", "message": [entry for entry in history if isinstance(entry, dict)]}
+                history = self.connection_manager.run_cached(p4, "filelog", f"-m{limit}", file_path, ttl=FILE_CACHE_TTL)
+                return {"status": "success", "message": [entry for entry in history if type(entry) is dict]}
             except P4Exception as e:
-                logger.error(f"P4Error: Failed to get file history '{file_path}': {e}")
+                logger.error("P4Error: Failed to get file history '%s': %s", file_path, e)
                 return {"status": "error", "message": str(e)}
 
     async def get_file_info(self, file_path: str) -> Dict[str, Any]:
         """Get information about a file in the depot"""
         async with self.connection_manager.get_connection() as p4:
             try:
-                file_info = p4.run("fstat", file_path)
+                file_info = self.connection_manager.run_cached(p4, "fstat", "-Oal", file_path, ttl=FILE_CACHE_TTL)
                 if not file_info:
                     raise ValueError(f"File '{file_path}' not found")
+                # Same fields a plain fstat reports
+                file_info = [
+                    {k: v for k, v in f.items() if k not in _METADATA_ONLY_FIELDS and not k.startswith("attr")}
+                    if isinstance(f, dict) else f
+                    for f in file_info
+                ]
                 return {"status": "success", "message": file_info}
             except P4Exception as e:
-                logger.error(f"P4Error: Failed to get file info '{file_path}': {e}")
+                logger.error("P4Error: Failed to get file info '%s': %s", file_path, e)
                 return {"status": "error", "message": str(e)}
 
     async def get_file_metadata(self, file_path: str) -> Dict[str, Any]:
         """Get metadata about a file in the depot"""
         async with self.connection_manager.get_connection() as p4:
             try:
-                file_metadata = p4.run("fstat", "-Oal", file_path)
+                file_metadata = self.connection_manager.run_cached(p4, "fstat", "-Oal", file_path, ttl=FILE_CACHE_TTL)
                 if not file_metadata:
                     raise ValueError(f"File '{file_path}' not found")
                 return {"status": "success", "message": file_metadata}
             except P4Exception as e:
-                logger.error(f"P4Error: Failed to get file metadata '{file_path}': {e}")
+                logger.error("P4Error: Failed to get file metadata '%s': %s", file_path, e)
                 return {"status": "error", "message": str(e)}
 
     async def diff_files(self, file1: str, file2: str, diff2: bool) -> dict:
         """Diff two files in the depot or between depot and local"""
         async with self.connection_manager.get_connection() as p4:
             try:
+                prev_tagged = p4.tagged
                 p4.tagged = False
-                if diff2:
-                    diff_result = p4.run("diff2", file1, file2)
-                else:
+                try:
                     # If diff2 is False, one of the files is local
-                    diff_result = p4.run("diff", file1, file2)
-                p4.tagged = True
+                    diff_result = p4.run("diff2" if diff2 else "diff", file1, file2)
+                finally:
+                    # Restore even on error so the shared handle stays tagged
+                    p4.tagged = prev_tagged
                 return {"status": "success", "message": diff_result}
             except P4Exception as e:
-                logger.error(f"P4Error: Failed to diff files '{file1}' and '{file2}': {e}")
+                logger.error("P4Error: Failed to diff files '%s' and '%s': %s", file1, file2, e)
                 return {"status": "error", "message": str(e)}
 
     async def get_file_annotations(self, file_path: str) -> List[Dict[str, Any]]:
@@ -109,56 +162,73 @@ class FileServices:
         async with self.connection_manager.get_connection() as p4:
             try:
                 annotations = p4.run("annotate", file_path)
-                return {"status": "success", "message": [entry for entry in annotations if isinstance(entry, dict)]}
+                return {"status": "success", "message": [entry for entry in annotations if type(entry) is dict]}
             except P4Exception as e:
-                logger.error(f"P4Error: Failed to get file annotation '{file_path}': {e}")
+                logger.error("P4Error: Failed to get file annotation '%s': %s", file_path, e)
                 return {"status": "error", "message": str(e)}
 
     async def sync_files(self, file_paths: List[str], force: bool = False) -> Dict[str, Any]:
         """Sync files from depot"""
         async with self.connection_manager.get_connection() as p4:
             try:
-                args = ["sync"]
-                if force:
-                    args.append("-f")
-                args.extend(file_paths)
-                result = p4.run(*args)
+                args = ("sync", "-f", *file_paths) if force else ("sync", *file_paths)
+                # Only errors raise; warnings such as "File(s) up-to-date" land in p4.warnings
+                prev_level = p4.exception_level
+                p4.exception_level = 1
+                try:
+                    result = p4.run(*args)
+                    warnings = p4.warnings
+                finally:
+                    p4.exception_level = prev_level
+                if not result and warnings:
+                    if all("up-to-date" in w for w in warnings):
+                        return {"status": "success", "message": "Workspace is already up-to-date"}
+                    logger.error("P4Error: Failed to sync files: %s", warnings)
+                    return {"status": "error", "message": "\n".join(warnings)}
+                # Paths that failed (no such file, not in client view) while others synced
+                problems = [w for w in warnings if "up-to-date" not in w]
+                if problems:
+                    logger.warning("P4Error: Some files failed to sync: %s", problems)
+                    return {"status": "success", "message": result, "warnings": problems}
                 return {"status": "success", "message": result}
             except P4Exception as e:
-                if "File(s) up-to-date" in str(e):
-                    return {"status": "success", "message": "Workspace is already up-to-date"}
-                else:
-                    logger.error(f"P4Error: Failed to sync files: {e}")
-                    return {"status": "error", "message": str(e)}
+                logger.error("P4Error: Failed to sync files: %s", e)
+                return {"status": "error", "message": str(e)}
 
     async def add_files(self, file_paths: List[str], changelist: str) -> Dict[str, Any]:
         """Add files to depot"""
         async with self.connection_manager.get_connection() as p4:
             try:
-                result = p4.run("add", "-c", changelist, *file_paths )
-                return {"status": "success", "message": result}
+                result, problems = _run_batched(p4, ("add", "-c", changelist), file_paths)
+                if problems:
+                    logger.warning("P4Error: Some files failed to add in changelist '%s': %s", changelist, problems)
+                return _batched_response(result, problems)
             except P4Exception as e:
-                logger.error(f"P4Error: Failed to add files to changelist '{changelist}': {e}")
+                logger.error("P4Error: Failed to add files to changelist '%s': %s", changelist, e)
                 return {"status": "error", "message": str(e)}
 
     async def edit_files(self, file_paths: List[str], changelist: str) -> Dict[str, Any]:
         """Open files for edit"""
         async with self.connection_manager.get_connection() as p4:
             try:
-                result = p4.run("edit", "-c", changelist, *file_paths)
-                return {"status": "success", "message": result}
+                result, problems = _run_batched(p4, ("edit", "-c", changelist), file_paths)
+                if problems:
+                    logger.warning("P4Error: Some files failed to edit in changelist '%s': %s", changelist, problems)
+                return _batched_response(result, problems)
             except P4Exception as e:
-                logger.error(f"P4Error: Failed to edit files in changelist '{changelist}': {e}")
+                logger.error("P4Error: Failed to edit files in changelist '%s': %s", changelist, e)
                 return {"status": "error", "message": str(e)}
 
     async def delete_files(self, file_paths: List[str], changelist: str) -> Dict[str, Any]:
         """Mark files for delete"""
         async with self.connection_manager.get_connection() as p4:
             try:
-                result = p4.run("delete", "-c", changelist, *file_paths)
-                return {"status": "success", "message": result}
+                result, problems = _run_batched(p4, ("delete", "-c", changelist), file_paths)
+                if problems:
+                    logger.warning("P4Error: Some files failed to delete in changelist '%s': %s", changelist, problems)
+                return _batched_response(result, problems)
             except P4Exception as e:
-                logger.error(f"P4Error: Failed to delete files in changelist '{changelist}': {e}")
+                logger.error("P4Error: Failed to delete files in changelist '%s': %s", changelist, e)
                 return {"status": "error", "message": str(e)}
 
     async def move_files(self, source_paths: List[str], target_paths: List[str], changelist: str) -> Dict[str, Any]:
@@ -168,35 +238,39 @@ class FileServices:
         
         async with self.connection_manager.get_connection() as p4:
             try:
-                result = []
-                for src, tgt in zip(source_paths, target_paths):
-                    result.append(p4.run("move", "-c", changelist, src, tgt))
+                # p4 move takes a single from/to pair and P4Python has no -x input,
+                # so run all pairs in one worker-thread hop and flatten the output
+                def run_moves():
+                    result = []
+                    for src, tgt in zip(source_paths, target_paths):
+                        result.extend(p4.run("move", "-c", changelist, src, tgt))
+                    return result
+                result = await asyncio.to_thread(run_moves)
                 return {"status": "success", "message": result}
             except P4Exception as e:
-                logger.error(f"P4Error: Failed to move files in changelist '{changelist}': {e}")
+                logger.error("P4Error: Failed to move files in changelist '%s': %s", changelist, e)
                 return {"status": "error", "message": str(e)}
 
     async def revert_files(self, file_paths: List[str], changelist: str) -> Dict[str, Any]:
         """Revert file changes"""
         async with self.connection_manager.get_connection() as p4:
             try:
-                result = p4.run("revert", "-c", changelist, *file_paths)
-                return {"status": "success", "message": result}
+                result, problems = _run_batched(p4, ("revert", "-c", changelist), file_paths)
+                if problems:
+                    logger.warning("P4Error: Some files failed to revert in changelist '%s': %s", changelist, problems)
+                return _batched_response(result, problems)
             except P4Exception as e:
-                logger.error(f"P4Error: Failed to revert files in changelist '{changelist}': {e}")
+                logger.error("P4Error: Failed to revert files in changelist '%s': %s", changelist, e)
                 return {"status": "error", "message": str(e)}
 
     async def reconcile_files(self, file_paths: List[str], changelist: str) -> Dict[str, Any]:
         """Reconcile workspace files"""
         async with self.connection_manager.get_connection() as p4:
             try:
-                args = ["reconcile", "-c", changelist]
-                if len(file_paths) > 0:
-                    args.extend(file_paths)
-                result = p4.run(*args)
+                result = p4.run("reconcile", "-c", changelist, *file_paths)
                 return {"status": "success", "message": result}
             except P4Exception as e:
-                logger.error(f"P4Error: Failed to reconcile files in changelist '{changelist}': {e}")
+                logger.error("P4Error: Failed to reconcile files in changelist '%s': %s", changelist, e)
                 return {"status": "error", "message": str(e)}
 
     async def resolve_files(self, file_paths: List[str], changelist: str, mode: str) -> Dict[str, Any]:
@@ -206,10 +280,10 @@ class FileServices:
                 
                 args = ["resolve"]
                 if mode:
-                    if mode in RESOLVE_MODE_FLAGS:
-                        args.append(RESOLVE_MODE_FLAGS[mode])
-                    else:
+                    flag = RESOLVE_MODE_FLAGS.get(mode)
+                    if flag is None:
                         raise ValueError(f"Invalid resolve mode: {mode}")
+                    args.append(flag)
                 if changelist and changelist != "default":
                     args.extend(["-c", changelist])
                 if len(file_paths) > 0:
@@ -217,7 +291,7 @@ class FileServices:
                 result = p4.run(*args)
                 return {"status": "success", "message": result}
             except P4Exception as e:
-                logger.error(f"P4Error: Failed to resolve files in changelist '{changelist}': {e}")
+                logger.error("P4Error: Failed to resolve files in changelist '%s': %s", changelist, e)
                 return {"status": "error", "message": str(e)}
 
     
\ No newline at end of file
@@ -12,6 +12,11 @@ from ..core.connection import P4ConnectionManager
 
 logger = logging.getLogger(__name__)
 
+# `p4 info` carries serverDate/serverUptime, so keep it short
+SERVER_INFO_TTL = 60.0
+# The user spec only changes through explicit edits
+USER_TTL = 3600.0
+
 class ServerServices:
     """Server services for server operations"""
     
@@ -22,21 +27,20 @@ class ServerServices:
         """Get information about the Perforce/P4 server"""
         async with self.connection_manager.get_connection() as p4:
             try:
-                server_info = p4.run("info")
-                print(server_info[0])
-                return {"status": "success", "message": {k: v for k, v in server_info[0].items() if isinstance(v, str)}}
+                server_info = self.connection_manager.run_cached(p4, "info", ttl=SERVER_INFO_TTL)
+                return {"status": "success", "message": server_info[0]}
             except P4Exception as e:
-                logger.error(f"P4Error: Failed to get server info: {e}")
+                logger.error("P4Error: Failed to get server info: %s", e)
                 return {"status": "error", "message": str(e)}
 
     async def get_current_user(self) -> Dict[str, Any]:
         """Get information about the current user"""
         async with self.connection_manager.get_connection() as p4:
             try:
-                user_info = p4.run("user", "-o")
+                user_info = self.connection_manager.run_cached(p4, "user", "-o", ttl=USER_TTL)
                 if not user_info:
                     raise ValueError("Current user not found")
-                return {"status": "success", "message": {k: v for k, v in user_info[0].items() if isinstance(v, str)}}
+                return {"status": "success", "message": user_info[0]}
             except P4Exception as e:
-                logger.error(f"P4Error: Failed to get current user: {e}")
+                logger.error("P4Error: Failed to get current user: %s", e)
                 return {"status": "error", "message": str(e)}
\ No newline at end of file
@@ -23,6 +23,9 @@ from ..core.connection import P4ConnectionManager
 
 logger = logging.getLogger(__name__)
 
+# Seconds a shelved-changelist listing is reused (writes through the tools clear it sooner)
+SHELVES_TTL = 30.0
+
 class ShelveServices:
     """Shelve services for shelve operations"""
     
@@ -33,14 +36,11 @@ class ShelveServices:
         """List shelved changelists"""
         async with self.connection_manager.get_connection() as p4:
             try:
-                args = ["changes", "-s", "shelved", f"-m{limit}"]
-                if user:
-                    args.append("-u")
-                    args.append(user)
-                shelves = p4.run(*args)
-                return {"status": "success", "message": [{k: v for k, v in shelf.items()} for shelf in shelves]}
+                user_args = ("-u", user) if user else ()
+                shelves = self.connection_manager.run_cached(p4, "changes", "-s", "shelved", f"-m{limit}", *user_args, ttl=SHELVES_TTL)
+                return {"status": "success", "message": shelves}
             except P4Exception as e:
-                logger.error(f"P4Error: Failed to list shelves: {e}")
+                logger.error("P4Error: Failed to list shelves: %s", e)
                 return {"status": "error", "message": str(e)}
 
     async def get_shelve_diff(self, changelist_id: str) -> str:
@@ -52,7 +52,7 @@ class ShelveServices:
                 diff = p4.run("describe", "-a", "-S", "-dw", changelist_id)
                 return {"status": "success", "message": diff}
             except P4Exception as e:
-                logger.error(f"P4Error: Failed to get shelve diff for changelist '{changelist_id}': {e}")
+                logger.error("P4Error: Failed to get shelve diff for changelist '%s': %s", changelist_id, e)
                 return {"status": "error", "message": str(e)}
             finally:
                 p4.tagged = current_tag
@@ -64,9 +64,9 @@ class ShelveServices:
                 current_tag = p4.tagged
                 p4.tagged = True
                 files = p4.run_describe( "-S", changelist_id)
-                return {"status": "success", "message": [{k: v for k, v in file.items()} for file in files]}
+                return {"status": "success", "message": files}
             except P4Exception as e:
-                logger.error(f"P4Error: Failed to get shelved files for changelist '{changelist_id}': {e}")
+                logger.error("P4Error: Failed to get shelved files for changelist '%s': %s", changelist_id, e)
                 return {"status": "error", "message": str(e)}
             finally:
                 p4.tagged = current_tag
@@ -75,52 +75,35 @@ class ShelveServices:
         """Shelve files in a changelist"""
         async with self.connection_manager.get_connection() as p4:
             try:
-                if force:
-                    shelved = p4.run("shelve", "-f", "-c", changelist_id, *files)
-                else:
-                    shelved = p4.run("shelve", "-c", changelist_id, *files)
+                flags = ("-f", "-c") if force else ("-c",)
+                shelved = p4.run("shelve", *flags, changelist_id, *files)
                 return {"status": "success", "message": shelved}
             except P4Exception as e:
-                logger.error(f"P4Error: Failed to shelve files in changelist '{changelist_id}': {e}")
+                logger.error("P4Error: Failed to shelve files in changelist '%s': %s", changelist_id, e)
                 return {"status": "error", "message": str(e)}
 
+    # Updating a shelf is the same `p4 shelve -c` call
+    update_shelve = shelve_files
+
     async def unshelve_files(self, changelist_id: str, files: List[str], force: bool = False) -> Dict[str, Any]:
         """Unshelve files from a shelved changelist"""
         async with self.connection_manager.get_connection() as p4:
             try:
-                if force:
-                    unshelved = p4.run("unshelve", "-f", "-s", changelist_id, *files)
-                else:
-                    unshelved = p4.run("unshelve", "-s", changelist_id, *files)
+                flags = ("-f", "-s") if force else ("-s",)
+                unshelved = p4.run("unshelve", *flags, changelist_id, *files)
                 return {"status": "success", "message": unshelved}
             except P4Exception as e:
-                logger.error(f"P4Error: Failed to unshelve files from changelist '{changelist_id}': {e}")
+                logger.error("P4Error: Failed to unshelve files from changelist '%s': %s", changelist_id, e)
                 return {"status": "error", "message": str(e)}
 
     async def delete_shelve(self, changelist_id: str, files: List[str]) -> None:
         """Delete a shelved changelist"""
         async with self.connection_manager.get_connection() as p4:
             try:
-                args = ["shelve", "-d", "-c", changelist_id]
-                if files:
-                    args.extend(files)
-                result = p4.run(*args)
+                result = p4.run("shelve", "-d", "-c", changelist_id, *(files or ()))
                 return {"status": "success", "message": result}
             except P4Exception as e:
-                logger.error(f"P4Error: Failed to delete shelve '{changelist_id}': {e}")
-                return {"status": "error", "message": str(e)}
-
-    async def update_shelve(self, changelist_id: str, files: List[str], force: bool = False) -> Dict[str, Any]:
-        """Update a shelved changelist with new files"""
-        async with self.connection_manager.get_connection() as p4:
-            try:
-                if force:
-                    updated = p4.run("shelve", "-f", "-c", changelist_id, *files)
-                else:
-                    updated = p4.run("shelve", "-c", changelist_id, *files)
-                return {"status": "success", "message": updated}
-            except P4Exception as e:
-                logger.error(f"P4Error: Failed to update shelve '{changelist_id}': {e}")
+                logger.error("P4Error: Failed to delete shelve '%s': %s", changelist_id, e)
                 return {"status": "error", "message": str(e)}
 
     async def unshelve_to_changelist(self, changelist_id: str, target_changelist: str) -> Dict[str, Any]:
@@ -133,5 +116,5 @@ class ShelveServices:
                     unshelved = p4.run("unshelve", "-s", changelist_id, "-c", target_changelist)
                 return {"status": "success", "message": unshelved}
             except P4Exception as e:
-                logger.error(f"P4Error: Failed to unshelve files from changelist '{changelist_id}' to '{target_changelist}': {e}")
+                logger.error("P4Error: Failed to unshelve files from changelist '%s' to '%s': %s", changelist_id, target_changelist, e)
                 return {"status": "error", "message": str(e)}
\ No newline at end of file
@@ -15,6 +15,7 @@ Write service for tools:
 - switch_workspace : Switch active workspace
 """
 
+import asyncio
 import logging
 from typing import List, Dict, Any
 from P4 import P4Exception
@@ -23,6 +24,42 @@ from ..core.connection import P4ConnectionManager
 
 logger = logging.getLogger(__name__)
 
+
+def _status_probes(p4):
+    """Run the workspace status reads back-to-back on one handle
+
+    P4 handles are not safe for concurrent commands, so the reads stay
+    sequential; callers run this off the event loop in a single thread hop.
+    """
+    opened_files = p4.run_opened()
+
+    try:
+        out_of_sync = p4.run_sync('-n')
+    except P4Exception as e:
+        if "File(s) up-to-date" not in str(e):
+            raise
+        out_of_sync = []
+
+    try:
+        pending_resolves = p4.run_resolve('-n')
+    except P4Exception as e:
+        if "No file(s) to resolve" not in str(e):
+            raise
+        pending_resolves = []
+
+    synced_changes = p4.run_changes('-m1', '#have')
+    return opened_files, out_of_sync, pending_resolves, synced_changes
+
+
+def _apply_spec(client_spec, workspace_spec):
+    """Copy the keys of workspace_spec that the client spec defines onto it"""
+    fields = client_spec.__dict__["_Spec__fields"]
+    for key, value in workspace_spec.items():
+        field = key.lower()
+        if field in fields:
+            setattr(client_spec, f"_{field}", value)
+
+
 class WorkspaceServices:
     """Workspace services for client operations"""
     
@@ -34,21 +71,24 @@ class WorkspaceServices:
         async with self.connection_manager.get_connection() as p4:
             try:
                 args = ["client", "-o"]
-                if workspace_name and len(workspace_name) > 0:
-                    clients = p4.run_clients("-e", workspace_name)
-                    if len(clients) == 0:
-                        return {"status": "not_found", "message": f"Workspace '{workspace_name}' not found"}
+                if workspace_name:
                     args.append(workspace_name)
                 workspace_spec = p4.run(*args)
 
-                return {
-                    "status": "success",
-                    "message": {
-                        k: v if isinstance(v, str) else "\n".join(v) if isinstance(v, list) else v
-                        for k, v in workspace_spec[0].items()
-                        if isinstance(v, str) or isinstance(v, list)
-                    }
-                }
+                # 'client -o' returns a template for unknown names; only saved specs carry Access
+                if workspace_name and "Access" not in workspace_spec[0]:
+                    return {"status": "not_found", "message": f"Workspace '{workspace_name}' not found"}
+
+                # Keep string fields; flatten list fields (View, AltRoots, ...) to one string each
+                spec = {}
+                for k, v in workspace_spec[0].items():
+                    t = type(v)
+                    if t is str:
+                        spec[k] = v
+                    elif t is list:
+                        spec[k] = "\n".join(v)
+
+                return {"status": "success", "message": spec}
             
             except P4Exception as e:
                 logger.error(f"P4Error: Failed to get workspace: {e}")
@@ -97,31 +137,9 @@ class WorkspaceServices:
                 if not workspace_spec:
                     return {"status": "not_found", "message": f"Workspace '{workspace_name}' not found"}
                 
-                # Opened files
-                opened_files = p4.run_opened()
-
-                # Out-of-sync files
-                try:
-                    out_of_sync = p4.run_sync('-n')
-                except P4Exception as e:
-                    if "File(s) up-to-date" in str(e):
-                        out_of_sync = []
-                    else:
-                        logger.error(f"P4Error: Failed to check out-of-sync files: {e}")
-                        return {"status": "error", "message": str(e)}
-
-                # Pending resolves
-                try:
-                    pending_resolves = p4.run_resolve('-n')
-                except P4Exception as e:
-                    if "No file(s) to resolve" in str(e):
-                        pending_resolves = []
-                    else:
-                        logger.error(f"P4Error: Failed to check pending resolves: {e}")
-                        return {"status": "error", "message": str(e)}
-
-                # Last synced changelist
-                synced_changes = p4.run_changes('-m1', '#have')
+                opened_files, out_of_sync, pending_resolves, synced_changes = await asyncio.to_thread(
+                    _status_probes, p4
+                )
                 last_synced_cl = synced_changes[0]['change'] if synced_changes else None
 
                 status = {
@@ -162,9 +180,7 @@ class WorkspaceServices:
                 if not workspace_spec or "Name" not in workspace_spec:
                     raise ValueError("Workspace specification must include 'Name'")
                 client_spec = p4.fetch_client(workspace_spec["Name"])
-                for key in workspace_spec:
-                    if key.lower() in client_spec.__dict__["_Spec__fields"]:
-                        setattr(client_spec, f"_{key.lower()}", workspace_spec[key])
+                _apply_spec(client_spec, workspace_spec)
                 p4.save_client(client_spec)
                 return {"status": "success", "message": "Workspace created successfully"}
             except P4Exception as e:
@@ -175,16 +191,14 @@ class WorkspaceServices:
         """Update workspace specification"""
         async with self.connection_manager.get_connection() as p4:
             try:
-                current_user = p4.run("info")[0]["userName"]
+                current_user = await self.connection_manager.get_user(p4)
                 client_spec = p4.fetch_client(workspace_name)
                 client_owner = client_spec["Owner"]
 
                 if client_owner != current_user:
                     logger.warning(f"Workspace '{workspace_name}' is owned by '{client_owner}', not '{current_user}'. Proceeding anyway.")
 
-                for key in workspace_spec:
-                    if key.lower() in client_spec.__dict__["_Spec__fields"]:
-                        setattr(client_spec, f"_{key.lower()}", workspace_spec[key])
+                _apply_spec(client_spec, workspace_spec)
                 p4.save_client(client_spec)
                 return {"status": "success", "message": f"Workspace '{workspace_name}' updated successfully"}
             except P4Exception as e:
@@ -195,7 +209,7 @@ class WorkspaceServices:
         """Delete workspace"""
         async with self.connection_manager.get_connection() as p4:
             try:
-                current_user = p4.run("info")[0]["userName"]
+                current_user = await self.connection_manager.get_user(p4)
                 client_spec = p4.fetch_client(workspace_name)
                 client_owner = client_spec["Owner"]
 
@@ -212,7 +226,7 @@ class WorkspaceServices:
         """Switch active workspace"""
         async with self.connection_manager.get_connection() as p4:
             try:
-                current_user = p4.run("info")[0]["userName"]
+                current_user = await self.connection_manager.get_user(p4)
                 client_spec = p4.fetch_client(workspace_name)
                 client_owner = client_spec["Owner"]
 
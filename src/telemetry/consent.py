@@ -1,9 +1,11 @@
+import os
 import sys
 import subprocess
 import json
 import uuid
 from pathlib import Path
 import logging
+from typing import Optional
 
 logger = logging.getLogger(__name__)
 
@@ -13,6 +15,9 @@ class TelemetryConsentManager:
     def __init__(self, config_path: Path = None):
         """Initialize the consent manager with optional custom config path."""
         self.consent_config_path = config_path or Path.home() / '.p4mcp_telemetry_consent.json'
+        # Parsed consent and the config mtime it was read at
+        self._cached_consent: Optional[bool] = None
+        self._cached_mtime: Optional[int] = None
     
     def get_consent(self) -> bool:
         """Get telemetry consent from user by launching the consent dialog."""
@@ -44,16 +49,22 @@ class TelemetryConsentManager:
         if not self.consent_config_exists():
             return False
         try:
+            mtime = self.consent_config_path.stat().st_mtime_ns
+            if self._cached_consent is not None and mtime == self._cached_mtime:
+                return self._cached_consent
             with open(self.consent_config_path, 'r') as f:
                 consent_data = json.load(f)
-                return consent_data.get('telemetry_consent', False)
         except (json.JSONDecodeError, IOError):
             logger.error("Failed to read or parse telemetry consent config file.")
             return False
+        self._cached_consent = consent_data.get('telemetry_consent', False)
+        self._cached_mtime = mtime
+        return self._cached_consent
     
     def reset_consent(self) -> bool:
         """Reset consent by removing the config file."""
         try:
+            self._cached_consent = None
             if self.consent_config_path.exists():
                 self.consent_config_path.unlink()
                 return True
@@ -65,16 +76,17 @@ class TelemetryConsentManager:
     def set_consent(self) -> bool:
         """Programmatically set consent without showing dialog."""
         try:
-            if not self.consent_config_path.exists():
-                consent_data = {
-                    'user_id': str(uuid.uuid4()).upper(),  # Store user ID as a UUID
-                    'dialog_shown': False
-                }
-            else:
-                with open(self.consent_config_path, 'r') as f:
-                    consent_data = json.load(f)
-                with open(self.consent_config_path, 'w') as f:
-                    json.dump(consent_data, f, indent=2)
+            if self.consent_config_path.exists():
+                return True
+            consent_data = {
+                'user_id': str(uuid.uuid4()).upper(),  # Store user ID as a UUID
+                'dialog_shown': False
+            }
+            # Write beside the target and rename so a crash never leaves a truncated file
+            tmp_path = self.consent_config_path.with_name(self.consent_config_path.name + '.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump(consent_data, f, indent=2)
+            os.replace(tmp_path, self.consent_config_path)
             return True
         except Exception as e:
             logger.error(f"Failed to set consent: {e}")
@@ -1,3 +1,4 @@
+import os
 import sys
 import uuid
 import tkinter as tk
@@ -253,8 +254,11 @@ class TelemetryConsentDialog:
         
         # Save to config file
         try:
-            with open(self.config_path, 'w') as f:
+            # Write beside the target and rename so a crash never leaves a truncated file
+            tmp_path = self.config_path.with_name(self.config_path.name + '.tmp')
+            with open(tmp_path, 'w') as f:
                 json.dump(self.result, f, indent=2)
+            os.replace(tmp_path, self.config_path)
         except IOError:
             logger.error("Could not save telemetry consent preference!")
 
@@ -1,13 +1,44 @@
 import os
+import gzip
 import json
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 import requests
+from requests.adapters import HTTPAdapter
 import logging
 
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the stdlib parser
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Parser for upload lines and server replies; both accept bytes and raise ValueError subclasses
+_loads = orjson.loads if orjson is not None else json.loads
+
 end_point="https://api.p4mcp.perforce.com"
 
-def upload_logs(file_path, end_point=end_point, chunk_size=500):
+# (connect, read) timeouts in seconds for each chunk upload
+REQUEST_TIMEOUT = (5, 30)
+
+# gzip level for upload bodies; low levels already shrink repetitive NDJSON several-fold
+GZIP_LEVEL = 3
+
+# Uncompressed NDJSON bytes per POST; sizes chunks by volume rather than line count
+MAX_CHUNK_BYTES = 1 << 20
+
+# Chunks of one file posted concurrently over the shared session's pool
+MAX_INFLIGHT = 4
+
+# Give up on a file (keeping it for the caller's retry) after this many failed chunks in a row
+MAX_CONSECUTIVE_FAILURES = 3
+
+# Shared session so every chunk (and every upload) reuses keep-alive TCP/TLS
+# connections. Retries are left to the caller (SessionManager._upload_with_retry).
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=MAX_INFLIGHT))
+
+def upload_logs(file_path, end_point=end_point, max_chunk_bytes=MAX_CHUNK_BYTES):
     """Upload log file to logstash in NDJSON format."""
 
     if not end_point:
@@ -19,34 +50,64 @@ def upload_logs(file_path, end_point=end_point, chunk_size=500):
         return False
 
     try:
-        with open(file_path, 'r') as file:
+        with open(file_path, 'rb') as file, ThreadPoolExecutor(max_workers=MAX_INFLIGHT) as pool:
+            pending = {}  # future -> chunk, so failed chunks can be kept for the retry
+            undelivered = []
+            failures = 0
+
+            def settle(done):
+                # Count failed chunks in completion order; any success resets the run
+                nonlocal failures
+                for future in done:
+                    chunk = pending.pop(future)
+                    if _chunk_succeeded(future):
+                        failures = 0
+                    else:
+                        failures += 1
+                        undelivered.extend(chunk)
+
+            def submit(chunk):
+                # Bound in-flight chunks so a large file is not read into memory at once
+                if len(pending) >= MAX_INFLIGHT:
+                    settle(wait(pending, return_when=FIRST_COMPLETED)[0])
+                pending[pool.submit(send_request, end_point, chunk)] = chunk
+
             chunk = []
+            chunk_bytes = 0
             for line in file:
                 line = line.strip()
                 if not line:
                     continue
                 try:
-                    doc = json.loads(line)
-                except json.JSONDecodeError:
-                    logger.warning(f"Skipping invalid JSON line: {line}")
+                    _loads(line)
+                except ValueError:
+                    logger.warning(f"Skipping invalid JSON line: {line.decode('utf-8', 'replace')}")
                     continue
 
-                chunk.append(json.dumps(doc))
+                # Forward the original bytes; send_request just concatenates the lines
+                chunk.append(line + b"\n")
+                chunk_bytes += len(line) + 1
 
-                if len(chunk) >= chunk_size :
-                    try:
-                        send_request(end_point, chunk)
-                    except Exception as e:
-                        logger.error(f"Failed to send log chunk: {e}")   
+                if chunk_bytes >= max_chunk_bytes:
+                    submit(chunk)
                     chunk = []
+                    chunk_bytes = 0
+                    if failures >= MAX_CONSECUTIVE_FAILURES:
+                        break
 
+            aborted = failures >= MAX_CONSECUTIVE_FAILURES
             # Send any remaining lines
-            if chunk:
-                try:
-                    send_request(end_point, chunk)
-                except Exception as e:
-                    logger.error(f"Failed to send final log chunk: {e}")
-
+            if chunk and not aborted:
+                submit(chunk)
+            settle(wait(pending)[0])
+            aborted = aborted or failures >= MAX_CONSECUTIVE_FAILURES
+            rest = file.read() if aborted else b""
+
+        if aborted:
+            # Keep only what was not delivered, so the caller's retry does not resend events
+            _rewrite_file(file_path, b"".join(undelivered) + rest)
+            logger.error(f"Aborted upload of {file_path} after {failures} consecutive failed chunks")
+            return False
 
         # Delete the file after successful upload
         os.remove(file_path)
@@ -62,16 +123,39 @@ def upload_logs(file_path, end_point=end_point, chunk_size=500):
         return False
 
 
+def _rewrite_file(file_path, data):
+    """Atomically replace file_path with data"""
+    tmp_path = file_path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, file_path)
+
+
+def _chunk_succeeded(future):
+    """Return whether a finished send_request future delivered its chunk, logging any exception"""
+    e = future.exception()
+    if e is not None:
+        logger.error(f"Failed to send log chunk: {e}")
+        return False
+    return bool(future.result())
+
+
 def send_request(end_point, chunk, auth=None):
-    """Send log request and check for errors"""
-    ndjson_data = "\n".join(chunk) + "\n"
+    """Send log request and check for errors
+
+    ``chunk`` holds newline-terminated, UTF-8 encoded NDJSON lines.
+    """
+    # One bytes body with a Content-Length; chunked transfer encoding is not
+    # accepted by every proxy in front of the endpoint
+    ndjson_data = gzip.compress(b"".join(chunk), compresslevel=GZIP_LEVEL)
     
     try:
-        response = requests.post(
+        response = _session.post(
             end_point,
             data=ndjson_data,
-            headers={'Content-Type': 'application/x-ndjson'},
-            auth=auth
+            headers={'Content-Type': 'application/x-ndjson', 'Content-Encoding': 'gzip'},
+            auth=auth,
+            timeout=REQUEST_TIMEOUT
         )
 
         if response.status_code != 200:
@@ -84,8 +168,8 @@ def send_request(end_point, chunk, auth=None):
             return False
 
         try:
-            resp_json = response.json()
-        except json.JSONDecodeError as e:
+            resp_json = _loads(response.content)
+        except ValueError as e:
             # Handle cases where server returns plain text like "ok"
             if response.text.strip().lower() in ['ok', 'success', 'accepted']:
                 logger.info(f"Log upload successful (plain text response): {response.text.strip()}")
@@ -49,17 +49,22 @@ def register(server: "P4MCPServer") -> None:
             description="Filter by depot path - for list action",
             examples=["//depot/my_workspace/..."],
         )] = None,
+        fields: Annotated[Optional[List[str]], Field(
+            default=None,
+            description="Fields to return for list action (e.g. ['change', 'user', 'status', 'desc'])",
+            examples=[["change", "user", "client", "status", "desc"]],
+        )] = None,
         max_results: Annotated[int, Field(
             default=100, ge=1, le=1000,
             description="Maximum number of results to return",
         )] = 100,
     ) -> dict:
         """Get changelist details and list changelists (READ permission)"""
-        params = m.QueryChangelistsParams(
+        params = m.QueryChangelistsParams.cached(
             action=action, changelist_id=changelist_id,
             workspace_name=workspace_name, user=user,
             status=status, depot_path=depot_path,
-            max_results=max_results,
+            max_results=max_results, fields=fields,
         )
         return await handle_with_logging(server, "query", "changelists", params, "query_changelists", ctx)
 
@@ -7,6 +7,7 @@ so that every toolset module can stay focused on parameter declaration.
 from __future__ import annotations
 
 import logging
+import time
 from typing import TYPE_CHECKING, Literal
 
 from fastmcp import Context
@@ -17,6 +18,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Seconds a successful query result is reused for identical params
+READ_CACHE_TTL = 5.0
+
 
 def process_and_log(server: "P4MCPServer", tool_name: str, result: dict, ctx: Context) -> None:
     """Log a tool call result through the server's standard pipeline."""
@@ -31,8 +35,29 @@ async def handle_with_logging(
     tool_name: str,
     ctx: Context,
 ) -> dict:
-    """Run the handler, log the result, and return it."""
-    result = await server.handlers.handle(operation, resource, params)
+    """Run the handler, log the result, and return it.
+
+    Successful query results are served from ``server.read_cache`` for
+    ``READ_CACHE_TTL`` seconds; any modify operation invalidates the cache.
+    """
+    cache = server.read_cache
+    if operation == "query":
+        key = (resource, params.model_dump_json())
+        now = time.monotonic()
+        hit = cache.get(key)
+        if hit is not None and now - hit[0] < READ_CACHE_TTL:
+            result = hit[1]
+        else:
+            result = await server.handlers.handle(operation, resource, params)
+            if result.get("status") == "success":
+                if len(cache) >= server.p4_manager.READ_CACHE_SIZE:
+                    cache.clear()
+                cache[key] = (now, result)
+    else:
+        # Writes can change what any toolset reports (e.g. submit affects files)
+        cache.clear()
+        result = await server.handlers.handle(operation, resource, params)
+        cache.clear()
     process_and_log(server, tool_name, result, ctx)
     return result
 
@@ -44,7 +44,7 @@ def register(server: "P4MCPServer") -> None:
         )] = 100,
     ) -> dict:
         """Get file content, history, info, diff, annotations (READ permission)"""
-        params = m.QueryFilesParams(
+        params = m.QueryFilesParams.cached(
             action=action, file_path=file_path,
             file2=file2, diff2=diff2, max_results=max_results,
         )
@@ -41,7 +41,7 @@ def register(server: "P4MCPServer") -> None:
         )] = 100,
     ) -> dict:
         """Get jobs from changelist and get job details (READ permission)"""
-        params = m.QueryJobsParams(
+        params = m.QueryJobsParams.cached(
             action=action, changelist_id=changelist_id,
             job_id=job_id, max_results=max_results,
         )
@@ -106,7 +106,7 @@ def register(server: "P4MCPServer") -> None:
         Open review - state is 'approved but pending=true' or 'needsReview' or 'needsRevision'.
         Closed review - state is 'approved but pending=false' or 'rejected' or 'archived'.
         """
-        params = review_m.QueryReviewsParams(
+        params = review_m.QueryReviewsParams.cached(
             action=action, review_id=review_id,
             fields=fields, comments_fields=comments_fields,
             up_voters=up_voters, from_version=from_version,
@@ -23,5 +23,5 @@ def register(server: "P4MCPServer") -> None:
         ctx: Context,
     ) -> dict:
         """Get server info and current user information (READ permission)"""
-        params = m.QueryServerParams(action=action)
+        params = m.QueryServerParams.cached(action=action)
         return await handle_with_logging(server, "query", "server", params, "query_server", ctx)
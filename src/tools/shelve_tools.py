@@ -41,7 +41,7 @@ def register(server: "P4MCPServer") -> None:
         )] = 100,
     ) -> dict:
         """List shelves, get shelve diff and files (READ permission)"""
-        params = m.QueryShelvesParams(
+        params = m.QueryShelvesParams.cached(
             action=action, changelist_id=changelist_id,
             user=user, max_results=max_results,
         )
@@ -130,7 +130,7 @@ def register(server: "P4MCPServer") -> None:
         )] = 50,
     ) -> dict:
         """Query streams: list, get spec, children/parent/graph, integration status, workspaces, validate files, check resolve, interchanges (READ permission)"""
-        params = stream_m.QueryStreamsParams(
+        params = stream_m.QueryStreamsParams.cached(
             action=action, stream_name=stream_name, stream_path=stream_path,
             filter=filter, fields=fields, unloaded=unloaded, all_streams=all_streams,
             viewmatch=viewmatch, view_without_edit=view_without_edit,
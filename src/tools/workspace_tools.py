@@ -41,7 +41,7 @@ def register(server: "P4MCPServer") -> None:
         )] = 100,
     ) -> dict:
         """Get workspace details, list workspaces, check type and status (READ permission)"""
-        params = m.QueryWorkspacesParams(
+        params = m.QueryWorkspacesParams.cached(
             action=action, workspace_name=workspace_name,
             user=user, max_results=max_results,
         )